@@ -11,6 +11,7 @@ Handles conversions between:
 Key principle: Data stores dates only. Calculate FY/CY for display/aggregation.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
@@ -74,6 +75,25 @@ def date_to_fy(date):
         return date.year
 
 
+def dates_to_fy(dates):
+    """
+    Vectorised date_to_fy() for many dates at once.
+
+    Args:
+        dates: Series, DatetimeIndex or datetime64 array (no NaT)
+
+    Returns:
+        ndarray: Financial year number per date (int)
+
+    Examples:
+        dates_to_fy(df['Date'])  → array([2024, 2024, ..., 2025])
+    """
+    months = np.asarray(dates).astype('datetime64[M]')
+    years = months.astype('datetime64[Y]').astype(int) + 1970
+    month_num = months.astype(int) % 12 + 1
+    return years + (month_num >= NGER_FY_START_MONTH)
+
+
 def fy_to_date_range(fy):
     """
     Convert FY number to start and end dates.
@@ -172,11 +192,14 @@ def aggregate_by_year_type(df, year_type='FY', agg_dict=None):
             'SMC_Cumulative': 'last'  # Take end-of-year value
         })
     """
-    df = df.copy()
+    # Only the aggregated columns are carried into the groupby; the
+    # selection (or set_index below) already yields a new frame
+    if agg_dict:
+        df = df[['Date', *agg_dict]]
 
     # Ensure Date is datetime
     if not pd.api.types.is_datetime64_any_dtype(df['Date']):
-        df['Date'] = pd.to_datetime(df['Date'])
+        df = df.assign(Date=pd.to_datetime(df['Date']))
 
     # Set Date as index for Grouper
     df_indexed = df.set_index('Date')
@@ -188,8 +211,8 @@ def aggregate_by_year_type(df, year_type='FY', agg_dict=None):
             annual = df_indexed.groupby(pd.Grouper(freq=_FY_FREQ)).agg(agg_dict)
         else:
             annual = df_indexed.groupby(pd.Grouper(freq=_FY_FREQ)).sum(numeric_only=True)
-        # Label as FY
-        annual['Year'] = annual.index.map(lambda d: f"FY{date_to_fy(d)}")
+        # Label as FY (bins start 1 July, so the FY is the following year)
+        annual['Year'] = 'FY' + (annual.index.year + 1).astype(str)
     else:  # CY
         # YS-JAN = Year Start in January
         if agg_dict:
@@ -197,7 +220,7 @@ def aggregate_by_year_type(df, year_type='FY', agg_dict=None):
         else:
             annual = df_indexed.groupby(pd.Grouper(freq=_CY_FREQ)).sum(numeric_only=True)
         # Label as CY
-        annual['Year'] = annual.index.map(lambda d: f"CY{date_to_cy(d)}")
+        annual['Year'] = 'CY' + annual.index.year.astype(str)
 
     annual = annual.reset_index()
     return annual
@@ -257,6 +280,25 @@ def get_cy_label(date):
     return f"CY{date_to_cy(date)}"
 
 
+def year_labels_to_int(labels):
+    """
+    Parse a Series of "FY2024" / "CY2024" labels to integer years.
+
+    Labels always carry a two-letter prefix, so a fixed slice replaces
+    a per-row regex.
+
+    Args:
+        labels: Series of year label strings
+
+    Returns:
+        Series of int years
+
+    Examples:
+        year_labels_to_int(pd.Series(["FY2024", "CY2031"])) → [2024, 2031]
+    """
+    return labels.astype(str).str[2:].astype(int)
+
+
 def filter_by_fy(df, fy):
     """
     Filter DataFrame to a specific FY.
@@ -326,8 +368,17 @@ def period_filter(df, start_date, end_date, date_col='Date'):
     Returns:
         DataFrame: Filtered rows
     """
+    return df[period_mask(df, start_date, end_date, date_col)]
+
+
+def period_mask(df, start_date, end_date, date_col='Date'):
+    """Boolean ndarray for period_filter(), for combining with other masks.
+
+    Returns:
+        ndarray of bool: True where date_col is in [start_date, end_date)
+    """
     dates = pd.to_datetime(df[date_col])
-    return df[(dates >= pd.Timestamp(start_date)) & (dates < pd.Timestamp(end_date))]
+    return ((dates >= pd.Timestamp(start_date)) & (dates < pd.Timestamp(end_date))).values
 
 
 def year_to_date_range(year, year_type='FY'):
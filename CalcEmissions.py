@@ -63,6 +63,9 @@ def build_year_factor_map(nga_by_year, unique_years, state='QLD'):
     for year in unique_years:
         year_factors = {}
 
+        # Resolve all known prefixes for this year in one pass
+        nga_by_year.resolve_batch(year, FUEL_PREFIXES + ['Grid electricity'])
+
         # --- Fuel factors (Scope 1 and 3) ---
         for prefix in FUEL_PREFIXES:
             s1 = nga_by_year.match_fuel_factor(year, prefix, 1)
@@ -115,7 +118,51 @@ def build_year_factor_map(nga_by_year, unique_years, state='QLD'):
     return factor_map
 
 
-def apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY'):
+def _resolve_factor_key(nga_fuel, year_factors):
+    """Match an NGAFuel value to a factor key in one year's factor dict.
+
+    Exact match first, then longest key that is a prefix of nga_fuel
+    (so 'Diesel oil-Cars...' matches transport, not stationary 'Diesel oil'),
+    then a key that nga_fuel is a prefix of (truncated name in data).
+
+    Returns:
+        str factor key, or None if nothing matches
+    """
+    if nga_fuel in year_factors:
+        return nga_fuel
+
+    prefixes = [(k, len(k)) for k in year_factors if nga_fuel.startswith(k)]
+    if prefixes:
+        return max(prefixes, key=lambda x: x[1])[0]
+
+    reverse = [k for k in year_factors if k.startswith(nga_fuel)]
+    if reverse:
+        return reverse[0]
+
+    return None
+
+
+def resolve_factor_keys(year_factor_map, nga_fuels):
+    """Resolve every NGAFuel value to its factor key once, up front.
+
+    build_year_factor_map() produces the same keys for every year, so the
+    match only needs doing once per unique fuel name rather than inside
+    the per-fuel emissions loop.
+
+    Args:
+        year_factor_map: Dict from build_year_factor_map()
+        nga_fuels: Iterable of unique NGAFuel values
+
+    Returns:
+        dict: {nga_fuel: factor_key or None}
+    """
+    if not year_factor_map:
+        return {}
+    year_factors = next(iter(year_factor_map.values()))
+    return {fuel: _resolve_factor_key(fuel, year_factors) for fuel in nga_fuels}
+
+
+def apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY', factor_keys=None):
     """Apply emission calculations to a DataFrame using NGA factors.
 
     Shared logic used by both LoaderData.py (actuals) and Projections.py
@@ -129,6 +176,8 @@ def apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY'):
         agg_df: DataFrame with columns: Description, NGAFuel, UOM, Quantity, and fy_col
         year_factor_map: Dict from build_year_factor_map()
         fy_col: Name of the FY column (default 'FY')
+        factor_keys: Optional dict from resolve_factor_keys().  Resolved
+                     here from the unique NGAFuel values if not supplied.
 
     Returns:
         DataFrame with Scope1_tCO2e, Scope2_tCO2e, Scope3_tCO2e, Energy_GJ added
@@ -148,6 +197,8 @@ def apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY'):
         return agg_df
 
     fuel_values = agg_df.loc[has_fuel, 'NGAFuel'].unique()
+    if factor_keys is None:
+        factor_keys = resolve_factor_keys(year_factor_map, fuel_values)
 
     for nga_fuel in fuel_values:
         mask = has_fuel & (agg_df['NGAFuel'] == nga_fuel)
@@ -161,22 +212,8 @@ def apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY'):
             logger.warning(f"No factors for FY{sample_year}, skipping {nga_fuel}")
             continue
 
-        # Match NGAFuel to factor key: exact match first, then longest prefix
-        # Ensures 'Diesel oil-Cars...' matches transport, not stationary 'Diesel oil'
-        factor_key = None
-        if nga_fuel in year_factors:
-            factor_key = nga_fuel
-        else:
-            # Longest key that is a prefix of nga_fuel
-            prefixes = [(k, len(k)) for k in year_factors if nga_fuel.startswith(k)]
-            if prefixes:
-                factor_key = max(prefixes, key=lambda x: x[1])[0]
-            else:
-                # nga_fuel is a prefix of a key (truncated name in data)
-                reverse = [k for k in year_factors if k.startswith(nga_fuel)]
-                if reverse:
-                    factor_key = reverse[0]
-
+        # Pre-resolved: exact match first, then longest prefix
+        factor_key = factor_keys.get(nga_fuel)
         if factor_key is None:
             logger.warning(f"No factor match for NGAFuel='{nga_fuel}', skipping")
             continue
@@ -290,17 +327,7 @@ def build_safeguard_source_table(df, year_factor_map):
         yf_all = year_factor_map.get(fy, {})
 
         # Resolve factor key: exact then longest prefix, then reverse prefix
-        factor_key = None
-        if nga_fuel in yf_all:
-            factor_key = nga_fuel
-        else:
-            prefixes = [(k, len(k)) for k in yf_all if nga_fuel.startswith(k)]
-            if prefixes:
-                factor_key = max(prefixes, key=lambda x: x[1])[0]
-            else:
-                reverse = [k for k in yf_all if k.startswith(nga_fuel)]
-                if reverse:
-                    factor_key = reverse[0]
+        factor_key = _resolve_factor_key(nga_fuel, yf_all)
 
         if factor_key and factor_key in yf_all:
             yf = yf_all[factor_key]
@@ -24,6 +24,7 @@ Last updated: 2026-03-10
 """
 
 import os
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
@@ -166,6 +167,31 @@ def precompute_all(df, fsei_rom, fsei_elec,
 # ANNUAL AGGREGATION (shared logic, replaces prepare_annual_for_*)
 # ─────────────────────────────────────────────────────────────────────
 
+# Monthly -> annual aggregation spec.  The monthly schema is fixed by
+# build_projection(); optional columns are only present on some frames
+# (e.g. the GHG overlay has no safeguard metrics).
+_ANNUAL_AGG_REQUIRED = {
+    'Scope1_tCO2e': 'sum',
+    'Scope2_tCO2e': 'sum',
+    'Scope3_tCO2e': 'sum',
+    'ROM_t': 'sum',
+}
+_ANNUAL_AGG_OPTIONAL = {
+    'Site_Electricity_kWh': 'sum',
+    'Grid_Electricity_kWh': 'sum',
+    'Baseline': 'sum',
+    'SMC_Monthly': 'sum',
+    'Baseline_Unfloored': 'sum',
+    'Phase': 'last',
+    'SMC_Cumulative': 'last',
+    'In_Safeguard': 'last',
+    'Exit_FY': 'last',
+    'SMC_Phase': 'last',
+    'Baseline_Intensity': 'mean',
+    'Emission_Intensity': 'mean',
+}
+
+
 def _aggregate_annual(monthly, year_type='FY'):
     """Aggregate monthly projection to annual with all columns tabs need.
 
@@ -179,72 +205,60 @@ def _aggregate_annual(monthly, year_type='FY'):
     Returns:
         Annual DataFrame with standardised column names
     """
-    agg_dict = {
-        'Scope1_tCO2e': 'sum',
-        'Scope2_tCO2e': 'sum',
-        'Scope3_tCO2e': 'sum',
-        'ROM_t': 'sum',
-    }
-
-    # Optional columns — include if present
-    optional_sum = ['Site_Electricity_kWh', 'Grid_Electricity_kWh',
-                    'Baseline', 'SMC_Monthly', 'Baseline_Unfloored']
-    optional_last = ['Phase', 'SMC_Cumulative', 'In_Safeguard',
-                     'Exit_FY', 'SMC_Phase']
-    optional_mean = ['Baseline_Intensity', 'Emission_Intensity']
-
-    for col in optional_sum:
-        if col in monthly.columns:
-            agg_dict[col] = 'sum'
-    for col in optional_last:
-        if col in monthly.columns:
-            agg_dict[col] = 'last'
-    for col in optional_mean:
-        if col in monthly.columns:
-            agg_dict[col] = 'mean'
+    # Required columns first, then whichever optional columns are present
+    # (spec order is kept so the annual column order does not change)
+    agg_dict = dict(_ANNUAL_AGG_REQUIRED)
+    agg_dict.update(
+        (col, how) for col, how in _ANNUAL_AGG_OPTIONAL.items() if col in monthly.columns
+    )
 
     annual = aggregate_by_year_type(monthly, year_type, agg_dict=agg_dict)
 
+    # All derived columns are collected first and added with one assign,
+    # rather than inserted one by one (each insert fragments the frame)
+    columns = annual.columns
+
     # ── Compatibility columns (tabs expect these names) ──
-    annual['FY'] = annual['Year']
-    annual['Scope1'] = annual['Scope1_tCO2e']
-    annual['Scope2'] = annual['Scope2_tCO2e']
-    annual['Scope3'] = annual['Scope3_tCO2e']
-    annual['Total'] = annual['Scope1'] + annual['Scope2'] + annual['Scope3']
-    annual['ROM_Mt'] = annual['ROM_t'] / 1_000_000
+    new = dict(
+        FY=annual['Year'],
+        Scope1=annual['Scope1_tCO2e'],
+        Scope2=annual['Scope2_tCO2e'],
+        Scope3=annual['Scope3_tCO2e'],
+        Total=annual['Scope1_tCO2e'] + annual['Scope2_tCO2e'] + annual['Scope3_tCO2e'],
+        ROM_Mt=annual['ROM_t'] / 1_000_000,
+    )
 
     # Grid electricity in MWh (for carbon tax)
-    if 'Grid_Electricity_kWh' in annual.columns:
-        annual['Grid_Electricity_MWh'] = annual['Grid_Electricity_kWh'] / 1000.0
+    if 'Grid_Electricity_kWh' in columns:
+        new['Grid_Electricity_MWh'] = annual['Grid_Electricity_kWh'] / 1000.0
     else:
-        annual['Grid_Electricity_MWh'] = 0.0
+        new['Grid_Electricity_MWh'] = 0.0
 
     # Emission intensity columns - explicit by scope
-    annual['Scope1_Intensity'] = 0.0
-    annual['Total_Intensity'] = 0.0
-    mask = annual['ROM_Mt'] > 0
-    annual.loc[mask, 'Scope1_Intensity'] = (
-        annual.loc[mask, 'Scope1'] / (annual.loc[mask, 'ROM_Mt'] * 1_000_000)
-    )
-    annual.loc[mask, 'Total_Intensity'] = (
-        annual.loc[mask, 'Total'] / (annual.loc[mask, 'ROM_Mt'] * 1_000_000)
-    )
+    # (inner where keeps zero-ROM years out of the division)
+    rom_mt = new['ROM_Mt'].to_numpy()
+    has_rom = rom_mt > 0
+    rom_t = np.where(has_rom, rom_mt, 1.0) * 1_000_000
+    new['Scope1_Intensity'] = np.where(has_rom, new['Scope1'].to_numpy() / rom_t, 0.0)
+    new['Total_Intensity'] = np.where(has_rom, new['Total'].to_numpy() / rom_t, 0.0)
     # Legacy alias (consumers should migrate to explicit names)
-    annual['Emission_Intensity'] = annual['Scope1_Intensity']
+    new['Emission_Intensity'] = new['Scope1_Intensity'].copy()
 
     # SMC annual from monthly sum
-    if 'SMC_Monthly' in annual.columns:
-        annual['SMC_Annual'] = annual['SMC_Monthly']
-    elif 'SMC_Annual' not in annual.columns:
-        annual['SMC_Annual'] = 0.0
+    if 'SMC_Monthly' in columns:
+        new['SMC_Annual'] = annual['SMC_Monthly']
+    elif 'SMC_Annual' not in columns:
+        new['SMC_Annual'] = 0.0
 
     # Ensure electricity columns exist
     for col in ['Site_Electricity_kWh', 'Grid_Electricity_kWh']:
-        if col not in annual.columns:
-            annual[col] = 0
+        if col not in columns:
+            new[col] = 0
 
-    if 'Phase' not in annual.columns:
-        annual['Phase'] = 'Unknown'
+    if 'Phase' not in columns:
+        new['Phase'] = 'Unknown'
+
+    annual = annual.assign(**new)
 
     return annual
 
@@ -309,8 +323,7 @@ def build_carbon_tax_projection(annual, precomputed,
     """
     from Projections import carbon_tax_analysis
 
-    annual = annual.copy()
-
+    # carbon_tax_analysis returns a new frame and leaves annual untouched
     return carbon_tax_analysis(
         annual, tax_start_fy, tax_rate, tax_escalation,
         nga_by_year=precomputed.nga_by_year if include_scope2 else None,
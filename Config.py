@@ -26,6 +26,8 @@ Safeguard Mechanism baseline formula per Section 11:
 
 from datetime import datetime
 
+import numpy as np
+
 
 # =============================================================================
 # FISCAL YEAR
@@ -170,6 +172,19 @@ def get_transition_proportion(fy):
         return 1.0
 
 
+def get_transition_proportions(fys):
+    """Vectorised get_transition_proportion() for an array of financial years."""
+    fys = np.asarray(fys)
+    schedule_fys = np.array(sorted(TRANSITION_SCHEDULE))
+    schedule_h = np.array([TRANSITION_SCHEDULE[fy] for fy in schedule_fys])
+
+    idx = np.clip(np.searchsorted(schedule_fys, fys), 0, len(schedule_fys) - 1)
+    in_schedule = schedule_fys[idx] == fys
+
+    return np.where(fys < DECLINE_PHASE1_START, 0.0,
+                    np.where(in_schedule, schedule_h[idx], 1.0))
+
+
 # =============================================================================
 # s58B OPT-IN ELIGIBILITY PARAMETERS
 # =============================================================================
@@ -182,6 +197,9 @@ S58B_EARLIEST_FY = 2029
 S58B_LOOKBACK = 5
 S58B_MIN_COVERED = 3
 
+# SMC phase labels in canonical order (category codes 0..4 for SMC_Phase)
+SMC_PHASES = ['Pre-Safeguard', 'Safeguard', 'Gap', 'Opt-In', 'Exited']
+
 
 # =============================================================================
 # PHASE TRANSITION DATES
@@ -195,6 +213,9 @@ DEFAULT_END_PROCESSING_DATE = datetime(2039, 12, 31)     # Last day of processin
 DEFAULT_END_REHABILITATION_DATE = datetime(2044, 12, 31)  # Last day of rehabilitation
 DEFAULT_GRID_CONNECTION_DATE = datetime(2027, 7, 1)
 
+# Operational phase labels in canonical order (categories for Phase)
+PHASE_NAMES = ['Mining (Grid)', 'Mining', 'Processing', 'Rehabilitation', 'Closed']
+
 
 def get_phase_name(date, end_mining_date, end_processing_date,
                    end_rehabilitation_date, grid_connected_date=None):
@@ -215,6 +236,29 @@ def get_phase_name(date, end_mining_date, end_processing_date,
         return 'Closed'
 
 
+def get_phase_names(dates, end_mining_date, end_processing_date,
+                    end_rehabilitation_date, grid_connected_date=None):
+    """Vectorised get_phase_name() for an array of dates.
+
+    Returns an array of phase name strings, one per date.
+    """
+    dates = np.asarray(dates).astype('datetime64[ns]')
+    mining = dates <= np.datetime64(end_mining_date, 'ns')
+    if grid_connected_date is not None:
+        mining_grid = mining & (dates >= np.datetime64(grid_connected_date, 'ns'))
+    else:
+        mining_grid = np.zeros(len(dates), dtype=bool)
+
+    return np.select(
+        [mining_grid,
+         mining,
+         dates <= np.datetime64(end_processing_date, 'ns'),
+         dates <= np.datetime64(end_rehabilitation_date, 'ns')],
+        PHASE_NAMES[:-1],
+        default=PHASE_NAMES[-1]
+    )
+
+
 def get_phase_name_for_date(date, end_mining_date, end_processing_date,
                             end_rehabilitation_date, grid_connected_date):
     """Date-based phase label.  Direct date comparison, no FY conversion."""
@@ -335,6 +379,10 @@ COLORS = {
     'npi': '#3498DB',
 }
 
+# Line series longer than this are drawn with WebGL (Scattergl); shorter
+# ones stay SVG so they layer with bars and annotations
+WEBGL_MIN_POINTS = 100
+
 
 # =============================================================================
 # FILE PATHS
@@ -43,12 +43,13 @@ import io
 import pandas as pd
 import os
 from pathlib import Path
-from CalcCalendar import date_to_fy
+from CalcCalendar import dates_to_fy
 from Config import NGER_FY_START_MONTH, DIESEL_TRANSPORT_COSTCENTRES, DIESEL_TRANSPORT_NGAFUEL
 from LookupIdentifiers import enrich_with_lookup
 from LoaderNga import NGAFactorsByYear
 from CalcEmissions import (
     build_year_factor_map,
+    resolve_factor_keys,
     apply_emissions_to_df
 )
 
@@ -149,7 +150,7 @@ def load_all_data(actual_path=None,
     df['Year'] = df['Date'].dt.year
     df['Month'] = df['Date'].dt.month
     # Calculate FY from Date (July start = FY, not CY)
-    df['FY'] = df['Date'].apply(date_to_fy)
+    df['FY'] = dates_to_fy(df['Date'])
 
     print(f"Date range: {df['Date'].min():%Y-%m} to {df['Date'].max():%Y-%m}")
 
@@ -239,8 +240,13 @@ def load_all_data(actual_path=None,
     unique_years = agg_df['FY'].unique()
     year_factor_map = build_year_factor_map(nga_by_year, unique_years, state='QLD')
 
+    # Resolve each NGAFuel prefix to its factor key once, before the emissions loop
+    unique_prefixes = agg_df['NGAFuel'].dropna().unique()
+    factor_keys = resolve_factor_keys(year_factor_map, unique_prefixes)
+
     # Apply emissions to all rows based on NGAFuel and FY
-    agg_df = apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY')
+    agg_df = apply_emissions_to_df(agg_df, year_factor_map, fy_col='FY',
+                                   factor_keys=factor_keys)
 
     print(f'Emissions calculated')
     print(f"Total Scope 1: {agg_df['Scope1_tCO2e'].sum():,.0f} tCO\u2082-e")
@@ -262,6 +268,10 @@ def load_all_data(actual_path=None,
     agg_df['CommonName'] = agg_df['CommonName'].astype('category')
     agg_df['RowType'] = agg_df['RowType'].astype('category')
     agg_df['MatchKey'] = agg_df['MatchKey'].astype('category')
+    # High-cardinality metadata (invoice numbers, source files) stays string
+    # rather than category, but Arrow-backed to avoid per-row Python objects
+    agg_df['Source'] = agg_df['Source'].astype('string[pyarrow]')
+    agg_df['Identifier'] = agg_df['Identifier'].astype('string[pyarrow]')
     agg_df['Year'] = agg_df['Year'].astype('int16')
     agg_df['Month'] = agg_df['Month'].astype('int8')
     agg_df['FY'] = agg_df['FY'].astype('int16')
@@ -275,9 +285,12 @@ def load_all_data(actual_path=None,
     print(f'Memory optimized: {memory_mb:.2f} MB')
 
     # 8. RECREATE DATE COLUMN (for convenience, set to 1st of each month)
-    agg_df['Date'] = pd.to_datetime(
-        agg_df['Year'].astype(str) + '-' + agg_df['Month'].astype(str).str.zfill(2) + '-01'
-    )
+    # Built from the integer parts directly (no per-row string formatting)
+    agg_df['Date'] = pd.to_datetime({
+        'year': agg_df['Year'].astype('int32'),
+        'month': agg_df['Month'].astype('int32'),
+        'day': 1,
+    })
 
     # 9. SORT AND FINALIZE
     agg_df = agg_df.sort_values(['DataSet', 'Year', 'Month', 'Description']).reset_index(drop=True)
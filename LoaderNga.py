@@ -68,6 +68,10 @@ class NGAFactorsByYear:
             names = sorted(ydf['Fuel_Name'].unique(), key=len)
             self._fuel_names_by_year[year] = names
 
+        # Resolved (year, prefix) -> full name, filled by resolve_batch()
+        # and on first lookup of each prefix
+        self._resolved_names = {}
+
         print(f"\u2705 NGA factors loaded: {len(self.df)} rows, "
               f"years {self.available_years}")
 
@@ -79,8 +83,16 @@ class NGAFactorsByYear:
         """Resolve a fuel name prefix to the full NGA Fuel_Name.
 
         Tries exact match first, then startswith with shortest match.
-        Returns None if no match found.
+        Returns None if no match found.  Results are memoised per
+        (year, prefix) so repeat lookups are a single dict hit.
         """
+        key = (year, prefix)
+        if key not in self._resolved_names:
+            self._resolved_names[key] = self._match_fuel_name(year, prefix)
+        return self._resolved_names[key]
+
+    def _match_fuel_name(self, year, prefix):
+        """Uncached exact-then-startswith match used by _resolve_fuel_name."""
         names = self._fuel_names_by_year.get(year, [])
 
         # Exact match first
@@ -94,6 +106,25 @@ class NGAFactorsByYear:
 
         return None
 
+    def resolve_batch(self, year, prefixes):
+        """Resolve a known set of fuel name prefixes for one year up front.
+
+        The prefixes in the consolidated CSV are known before any factor
+        lookup runs, so resolving them all at once leaves every later
+        match_fuel_factor() call with a dict lookup instead of a scan.
+
+        Args:
+            year: NGA publication year (resolved to closest available)
+            prefixes: Iterable of NGAFuel prefixes
+
+        Returns:
+            dict: {prefix: full Fuel_Name or None}
+        """
+        year = self._resolve_year(year)
+        if year is None:
+            return {prefix: None for prefix in prefixes}
+        return {prefix: self._resolve_fuel_name(year, prefix) for prefix in prefixes}
+
     # ------------------------------------------------------------------
     # CORE LOOKUP
     # ------------------------------------------------------------------
@@ -200,16 +231,20 @@ class NGAFactorsByYear:
             raise ValueError(f"No NGA factors found for year {year}")
 
         # --- Electricity ---
-        electricity = {}
-        elec_rows = ydf[ydf['Fuel_Type'] == 'Electricity']
-        for _, row in elec_rows.iterrows():
-            st = row['State']
-            if pd.isna(st) or not st:
-                continue
-            if st not in electricity:
-                electricity[st] = {}
-            scope_key = f"scope{int(row['Scope'])}"
-            electricity[st][scope_key] = row['EF_kgCO2e_per_unit']
+        # Pivot State x Scope in one pass (last row wins on duplicates,
+        # matching the old row-by-row dict fill)
+        elec_rows = ydf[
+            (ydf['Fuel_Type'] == 'Electricity')
+            & ydf['State'].notna() & (ydf['State'] != '')
+        ]
+        pivot = elec_rows.pivot_table(
+            index='State', columns='Scope',
+            values='EF_kgCO2e_per_unit', aggfunc='last'
+        )
+        electricity = {
+            st: {f"scope{int(sc)}": val for sc, val in row.items() if pd.notna(val)}
+            for st, row in pivot.to_dict('index').items()
+        }
 
         # --- Diesel ---
         d_stat = self.match_fuel_factor(year, 'Diesel oil', 1)
@@ -22,7 +22,7 @@ Data flow:
 
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 
 from Config import (
@@ -38,10 +38,11 @@ from Config import (
     DECLINE_PHASE1_START, DECLINE_PHASE1_END, DECLINE_PHASE2_START, DECLINE_PHASE2_END,
     DEFAULT_GRID_CONNECTION_DATE, DEFAULT_START_DATE,
     DEFAULT_END_MINING_DATE, DEFAULT_END_PROCESSING_DATE, DEFAULT_END_REHABILITATION_DATE,
-    get_transition_proportion, get_phase_name_for_date,
+    get_transition_proportion, get_transition_proportions, get_phase_names,
     S58B_EARLIEST_FY, S58B_LOOKBACK, S58B_MIN_COVERED,
+    SMC_PHASES, PHASE_NAMES,
 )
-from CalcCalendar import date_to_fy, fy_to_date_range
+from CalcCalendar import date_to_fy, dates_to_fy, fy_to_date_range, year_labels_to_int
 from LoaderNga import NGAFactorsByYear
 from CalcEmissions import build_year_factor_map, apply_emissions_to_df
 
@@ -98,10 +99,7 @@ def build_projection(df, dataset='Actual',
     # When actuals exist for a (Date, MatchKey) pair, ALL budget rows for that
     # pair are excluded — preventing double-counting in the overlap period.
     merge_col = 'MatchKey' if 'MatchKey' in actuals.columns else 'SubActivity'
-    actual_keys = set(zip(actuals['Date'], actuals[merge_col]))
-    budget_fill = budget[
-        ~budget.apply(lambda r: (r['Date'], r[merge_col]) in actual_keys, axis=1)
-    ].copy()
+    budget_fill = budget[~_superseded_by_actuals(budget, actuals, merge_col)].copy()
 
     # Log Identifier coverage for traceability
     if 'Identifier' in budget_fill.columns:
@@ -153,7 +151,7 @@ def recalculate_emissions(data, nga_by_year):
     to ensure identical calculation logic between actuals and budget.
     """
     result = data.copy()
-    result['FY_temp'] = result['Date'].apply(date_to_fy)
+    result['FY_temp'] = dates_to_fy(result['Date'])
     unique_years = result['FY_temp'].unique()
     year_factor_map = build_year_factor_map(nga_by_year, unique_years, state='QLD')
     result = apply_emissions_to_df(result, year_factor_map, fy_col='FY_temp')
@@ -260,6 +258,32 @@ def calculate_erc_for_fy(fy, decline_rate_phase2=None):
     return max(erc_end_phase1 - (phase2_total * rate_p2), 0.0)
 
 
+def calculate_erc_for_fy_array(fys, decline_rate_phase2=None):
+    """Vectorised calculate_erc_for_fy() over an array of financial years.
+
+    Same linear Phase 1 / Phase 2 decline and post-FY2050 freeze, evaluated
+    for every FY in one pass.
+
+    Returns:
+        ndarray of ERC values, one per entry in fys
+    """
+    fys = np.asarray(fys)
+    rate_p2 = decline_rate_phase2 if decline_rate_phase2 is not None else DECLINE_RATE_PHASE2
+
+    # Phase 1: linear at 4.9%, n=1 for FY2024
+    n = fys - (DECLINE_PHASE1_START - 1)
+    phase1 = np.maximum(1.0 - (n * DECLINE_RATE_PHASE1), 0.0)
+
+    # Phase 2: linear continuation from Phase 1 end, frozen after FY2050
+    phase1_years = DECLINE_PHASE1_END - (DECLINE_PHASE1_START - 1)
+    erc_end_phase1 = 1.0 - (phase1_years * DECLINE_RATE_PHASE1)
+    phase2_years = np.minimum(fys, DECLINE_PHASE2_END) - DECLINE_PHASE1_END
+    phase2 = np.maximum(erc_end_phase1 - (phase2_years * rate_p2), 0.0)
+
+    return np.where(fys < DECLINE_PHASE1_START, 1.0,
+                    np.where(fys <= DECLINE_PHASE1_END, phase1, phase2))
+
+
 def calculate_hybrid_ei(fy, fsei_rom, fsei_elec,
                         default_ei_rom=DEFAULT_INDUSTRY_EI_ROM,
                         default_ei_elec=DEFAULT_INDUSTRY_EI_ELEC):
@@ -277,6 +301,20 @@ def calculate_hybrid_ei(fy, fsei_rom, fsei_elec,
     return hybrid_rom, hybrid_elec
 
 
+def calculate_hybrid_ei_array(fys, fsei_rom, fsei_elec,
+                              default_ei_rom=DEFAULT_INDUSTRY_EI_ROM,
+                              default_ei_elec=DEFAULT_INDUSTRY_EI_ELEC):
+    """Vectorised calculate_hybrid_ei() over an array of financial years.
+
+    Returns:
+        tuple: (hybrid_ei_rom, hybrid_ei_elec) arrays, one entry per FY
+    """
+    h = get_transition_proportions(fys)
+    hybrid_rom = (h * default_ei_rom) + ((1 - h) * fsei_rom)
+    hybrid_elec = (h * default_ei_elec) + ((1 - h) * fsei_elec)
+    return hybrid_rom, hybrid_elec
+
+
 def calculate_annual_baseline(fy, rom_t, site_mwh, fsei_rom, fsei_elec,
                               decline_rate_phase2=None):
     """Calculate Section 11 baseline for a financial year.
@@ -305,6 +343,12 @@ def calculate_annual_baseline(fy, rom_t, site_mwh, fsei_rom, fsei_elec,
 # =============================================================================
 
 
+# Per-phase SMC rules, indexed by SMC_Phase code (order of SMC_PHASES)
+#                                    Pre    Safeguard  Gap    Opt-In  Exited
+_SMC_PHASE_ACTIVE = np.array(       [True,  True,      False, True,   False])
+_SMC_PHASE_FLOOR_AT_ZERO = np.array([False, False,     False, True,   False])
+
+
 def calculate_safeguard_metrics(monthly, fsei_rom, fsei_elec, credit_start_date,
                                 end_mining_date, end_processing_date,
                                 end_rehabilitation_date,
@@ -315,10 +359,12 @@ def calculate_safeguard_metrics(monthly, fsei_rom, fsei_elec, credit_start_date,
     distributed to months proportionally by ROM and electricity.
     SMC credits/surrenders use three-phase model (safeguard/opt-in/exited).
     """
-    result = monthly.copy()
-
-    # Filter to Safeguard Mechanism start onwards
-    result = result[result['Date'] >= SAFEGUARD_START_DATE].copy()
+    # Filter to Safeguard Mechanism start onwards (take() is the only copy;
+    # all columns are kept since tabs read Scope 2/3 and grid from here)
+    all_dates = monthly['Date'].values.astype('datetime64[ns]', copy=False)
+    keep = np.flatnonzero(all_dates >= np.datetime64(SAFEGUARD_START_DATE, 'ns'))
+    result = monthly.take(keep)
+    dates = all_dates[keep]
     if len(result) == 0:
         for col in ['Phase', 'Emission_Intensity', 'Baseline_Intensity',
                     'Baseline', 'SMC_Monthly', 'SMC_Cumulative', 'In_Safeguard']:
@@ -326,87 +372,69 @@ def calculate_safeguard_metrics(monthly, fsei_rom, fsei_elec, credit_start_date,
         return result
 
     # --- Phase labels ---
-    result['Phase'] = result['Date'].apply(lambda d: get_phase_name_for_date(
-        d, end_mining_date, end_processing_date, end_rehabilitation_date, DEFAULT_GRID_CONNECTION_DATE
-    ))
+    result['Phase'] = pd.Categorical(get_phase_names(
+        dates, end_mining_date, end_processing_date, end_rehabilitation_date,
+        DEFAULT_GRID_CONNECTION_DATE
+    ), categories=PHASE_NAMES)
+
+    # Production quantities arrive as float32 from LoaderData; keep them
+    # narrow for the mask/distribution passes.  Scope 1 stays float64 since
+    # it is tested against the 100k threshold and feeds SMC directly.
+    # Per-FY totals (np.bincount) always accumulate in float64.
+    for col in ('ROM_t', 'Site_Electricity_kWh'):
+        result[col] = result[col].astype(np.float32, copy=False)
 
     # --- Actual emission intensity (Scope 1 / ROM) ---
-    result['Emission_Intensity'] = 0.0
-    mask_rom = result['ROM_t'] > 0
-    result.loc[mask_rom, 'Emission_Intensity'] = (
-        result.loc[mask_rom, 'Scope1_tCO2e'] / result.loc[mask_rom, 'ROM_t']
-    )
+    rom = result['ROM_t'].values
+    s1 = result['Scope1_tCO2e'].values
+    has_rom = rom > 0
+    safe_rom = np.where(has_rom, rom, 1.0)
+    result['Emission_Intensity'] = np.where(has_rom, s1 / safe_rom, 0.0)
 
     # --- Section 11 baseline (calculated per FY, distributed to months) ---
-    result['_fy'] = result['Date'].apply(date_to_fy)
+    # FYs are factorised once; the codes (0..K-1) drive every per-FY total
+    # and gather below, so no groupby or temporary FY column is needed
+    fys = dates_to_fy(dates).astype(np.int16)
+    fy_values, fy_codes = np.unique(fys, return_inverse=True)
 
     # Annual totals for production variables
-    fy_rom = result.groupby('_fy')['ROM_t'].sum()
-    fy_site_mwh = result.groupby('_fy')['Site_Electricity_kWh'].sum() / 1000  # kWh to MWh
-
-    # Calculate annual baseline per FY (both floored and unfloored per s56(4))
-    fy_baselines = {}
-    fy_baselines_unfloored = {}
-    for fy in sorted(result['_fy'].unique()):
-        rom_annual = fy_rom.get(fy, 0)
-        site_mwh_annual = fy_site_mwh.get(fy, 0)
-        floored, unfloored = calculate_annual_baseline(
-            fy, rom_annual, site_mwh_annual, fsei_rom, fsei_elec, decline_rate_phase2
-        )
-        fy_baselines[fy] = floored
-        fy_baselines_unfloored[fy] = unfloored
+    fy_rom = np.bincount(fy_codes, weights=result['ROM_t'].values)
+    fy_site_mwh = np.bincount(fy_codes, weights=result['Site_Electricity_kWh'].values) / 1000  # kWh to MWh
+    fy_scope1 = np.bincount(fy_codes, weights=s1)
+
+    # Per-FY Section 11 parameters (ERC, hybrid EI) computed once up front
+    # and reused for both the annual baseline and the monthly distribution
+    fy_hybrid_rom, fy_hybrid_elec = calculate_hybrid_ei_array(fy_values, fsei_rom, fsei_elec)
+    fy_table = pd.DataFrame({
+        'ERC': calculate_erc_for_fy_array(fy_values, decline_rate_phase2),
+        'Hybrid_ROM': fy_hybrid_rom,
+        'Hybrid_Elec': fy_hybrid_elec,
+    }, index=fy_values)
+
+    # Annual baseline per FY (both floored and unfloored per s56(4))
+    # Same formula as calculate_annual_baseline(), evaluated for all FYs at once
+    fy_table['Baseline_Unfloored'] = fy_table['ERC'] * (
+        (fy_table['Hybrid_ROM'] * fy_rom)
+        + (fy_table['Hybrid_Elec'] * fy_site_mwh)
+    )
+    fy_table['Baseline'] = np.maximum(fy_table['Baseline_Unfloored'], SAFEGUARD_MINIMUM_BASELINE)
 
     # Distribute annual baseline to months proportionally
     # Weight = month's (ROM contribution + electricity contribution) / FY total
     # This ensures months with more production get more baseline allocation
-    result['Baseline'] = 0.0
-
-    for fy, annual_baseline in fy_baselines.items():
-        fy_mask = result['_fy'] == fy
-        fy_rows = result[fy_mask]
-
-        if len(fy_rows) == 0:
-            continue
-
-        # Monthly weights based on production share
-        hybrid_rom, hybrid_elec = calculate_hybrid_ei(fy, fsei_rom, fsei_elec)
-        month_rom_contrib = fy_rows['ROM_t'] * hybrid_rom
-        month_elec_contrib = (fy_rows['Site_Electricity_kWh'] / 1000) * hybrid_elec
-        month_total = month_rom_contrib + month_elec_contrib
-
-        total_weight = month_total.sum()
-        if total_weight > 0:
-            # Distribute proportionally
-            result.loc[fy_mask, 'Baseline'] = (month_total / total_weight) * annual_baseline
-        else:
-            # No production â€” distribute evenly across months
-            n_months = len(fy_rows)
-            result.loc[fy_mask, 'Baseline'] = annual_baseline / n_months
-
-    # Distribute unfloored baseline to months (for SMC calculation per s56(4))
-    result['Baseline_Unfloored'] = 0.0
-    for fy, annual_baseline_uf in fy_baselines_unfloored.items():
-        fy_mask = result['_fy'] == fy
-        fy_rows = result[fy_mask]
-        if len(fy_rows) == 0:
-            continue
-        hybrid_rom, hybrid_elec = calculate_hybrid_ei(fy, fsei_rom, fsei_elec)
-        month_rom_contrib = fy_rows['ROM_t'] * hybrid_rom
-        month_elec_contrib = (fy_rows['Site_Electricity_kWh'] / 1000) * hybrid_elec
-        month_total = month_rom_contrib + month_elec_contrib
-        total_weight = month_total.sum()
-        if total_weight > 0:
-            result.loc[fy_mask, 'Baseline_Unfloored'] = (month_total / total_weight) * annual_baseline_uf
-        else:
-            n_months = len(fy_rows)
-            result.loc[fy_mask, 'Baseline_Unfloored'] = annual_baseline_uf / n_months
+    # Floored and unfloored (for SMC calculation per s56(4)) in one pass
+    result['Baseline'], result['Baseline_Unfloored'] = _distribute_baseline_to_months(
+        fy_codes,
+        result['ROM_t'].values,
+        result['Site_Electricity_kWh'].values / 1000,
+        fy_table['Hybrid_ROM'].values,
+        fy_table['Hybrid_Elec'].values,
+        fy_table['Baseline'].values,
+        fy_table['Baseline_Unfloored'].values,
+    )
 
     # Baseline intensity (baseline / ROM_t, for chart display)
-    result['Baseline_Intensity'] = 0.0
-    mask_rom2 = result['ROM_t'] > 0
-    result.loc[mask_rom2, 'Baseline_Intensity'] = (
-        result.loc[mask_rom2, 'Baseline'] / result.loc[mask_rom2, 'ROM_t']
-    )
+    result['Baseline_Intensity'] = np.where(has_rom, result['Baseline'].values / safe_rom, 0.0)
 
     # Intensity excess (positive = above baseline)
     result['Intensity_Excess'] = result['Emission_Intensity'] - result['Baseline_Intensity']
@@ -417,15 +445,14 @@ def calculate_safeguard_metrics(monthly, fsei_rom, fsei_elec, credit_start_date,
     # Phase 3 - EXITED: no credits or surrenders
 
     # Annual Safeguard status
-    result['In_Safeguard'] = result.groupby('_fy')['Scope1_tCO2e'].transform('sum') >= SAFEGUARD_THRESHOLD
+    fy_covered = fy_scope1 >= SAFEGUARD_THRESHOLD
+    result['In_Safeguard'] = fy_covered[fy_codes]
 
     # Raw SMC per s56(4): uses unfloored baseline
     # "BEN is the baseline emissions number ... as if subsection 10(1) had not been enacted"
-    result['SMC_Monthly'] = 0.0
-    credit_mask = result['Date'] >= credit_start_date
-    result.loc[credit_mask, 'SMC_Monthly'] = (
-        result.loc[credit_mask, 'Baseline_Unfloored'] - result.loc[credit_mask, 'Scope1_tCO2e']
-    )
+    credit_mask = dates >= np.datetime64(credit_start_date, 'ns')
+    smc = np.where(credit_mask, result['Baseline_Unfloored'].values - s1, 0.0)
+    result['SMC_Monthly'] = smc
 
     # =========================================================================
     # SMC PHASE ASSIGNMENT
@@ -439,67 +466,57 @@ def calculate_safeguard_metrics(monthly, fsei_rom, fsei_elec, credit_start_date,
     # Re-entry: if emissions bounce back above 100k, reverts to Safeguard.
     # =========================================================================
 
-    # Build per-FY annual Scope 1 totals
-    fy_scope1 = result.groupby('_fy')['Scope1_tCO2e'].sum()
-
-    # Track which FYs are "covered" (above threshold) for s58B lookback
-    covered_fys = set()
-    for fy, s1 in fy_scope1.items():
-        if s1 >= SAFEGUARD_THRESHOLD:
-            covered_fys.add(fy)
+    # s58B lookback counts over a dense FY axis (FYs with no rows count as
+    # not covered).  Prefix sums turn "covered FYs in [fy - N, fy)" into a
+    # single subtraction per FY.
+    min_fy = int(fy_values[0])
+    fy_pos = fy_values - min_fy
+    covered_dense = np.zeros(int(fy_values[-1]) - min_fy + 1, dtype=np.int32)
+    covered_dense[fy_pos] = fy_covered
+    cs = np.concatenate([[0], np.cumsum(covered_dense)])
+    covered_count = cs[fy_pos] - cs[np.maximum(fy_pos - S58B_LOOKBACK, 0)]
+    # Any covered FY from FY2024 up to (not including) this FY
+    any_prior_coverage = (cs[fy_pos] - cs[np.clip(2024 - min_fy, 0, fy_pos)]) > 0
 
     # Determine phase for each FY
-    fy_phase = {}
-    for fy in sorted(fy_scope1.index):
-        fy_start = fy_to_date_range(fy)[0]
-
-        if fy_start < credit_start_date:
-            fy_phase[fy] = 'Pre-Safeguard'
-        elif fy_scope1[fy] >= SAFEGUARD_THRESHOLD:
-            # Above 100k = covered by Safeguard
-            fy_phase[fy] = 'Safeguard'
-        else:
-            # Below 100k - check s58B eligibility
-            # Condition 1: FY must be >= S58B_EARLIEST_FY (FY2029)
-            # Condition 2: at least S58B_MIN_COVERED of previous S58B_LOOKBACK FYs covered
-            lookback_fys = range(fy - S58B_LOOKBACK, fy)
-            covered_count = sum(1 for y in lookback_fys if y in covered_fys)
-
-            if fy >= S58B_EARLIEST_FY and covered_count >= S58B_MIN_COVERED:
-                fy_phase[fy] = 'Opt-In'
-            else:
-                # Check if we ever were in Safeguard but lookback now fails
-                any_prior_coverage = any(y in covered_fys for y in range(2024, fy))
-                if any_prior_coverage and fy >= S58B_EARLIEST_FY and covered_count < S58B_MIN_COVERED:
-                    fy_phase[fy] = 'Exited'
-                else:
-                    fy_phase[fy] = 'Gap'
+    # Condition 1 for s58B: FY must be >= S58B_EARLIEST_FY (FY2029)
+    # Condition 2: at least S58B_MIN_COVERED of previous S58B_LOOKBACK FYs covered
+    # An FY is Pre-Safeguard when it starts before credit_start_date, i.e.
+    # its 1 July falls on or before the day before crediting begins
+    first_credit_fy = date_to_fy(credit_start_date - timedelta(days=1)) + 1
+    pre_mask = fy_values < first_credit_fy
+    s58b_window = fy_values >= S58B_EARLIEST_FY
+    lookback_ok = covered_count >= S58B_MIN_COVERED
+    # Phase codes index SMC_PHASES: 0 Pre-Safeguard, 1 Safeguard, 2 Gap,
+    # 3 Opt-In, 4 Exited
+    fy_phase = np.select(
+        [
+            pre_mask,
+            fy_covered,                                    # Above 100k = covered by Safeguard
+            s58b_window & lookback_ok,                     # Below 100k, s58B eligible
+            any_prior_coverage & s58b_window & ~lookback_ok,  # Was covered, lookback now fails
+        ],
+        [0, 1, 3, 4],
+        default=2,
+    ).astype(np.int8)
 
     # Map FY phases to monthly rows
-    result['SMC_Phase'] = result['_fy'].map(fy_phase).fillna('Pre-Safeguard')
+    phase_codes = fy_phase[fy_codes]
+    result['SMC_Phase'] = pd.Categorical.from_codes(phase_codes, categories=SMC_PHASES)
 
-    # Apply phase-specific SMC rules
+    # Apply phase-specific SMC rules in one pass via per-phase lookups
     # Safeguard: full credits and surrenders (already calculated as Baseline - Scope1)
-    # Gap: no credits, no surrenders
-    gap_mask = result['SMC_Phase'] == 'Gap'
-    result.loc[gap_mask, 'SMC_Monthly'] = 0.0
-
+    # Gap / Exited: no credits, no surrenders
     # Opt-In: credits only (floor at zero, no surrenders)
-    optin_mask = result['SMC_Phase'] == 'Opt-In'
-    result.loc[optin_mask & (result['SMC_Monthly'] < 0), 'SMC_Monthly'] = 0.0
-
-    # Exited: no credits, no surrenders
-    exited_mask = result['SMC_Phase'] == 'Exited'
-    result.loc[exited_mask, 'SMC_Monthly'] = 0.0
+    smc = np.where(_SMC_PHASE_ACTIVE[phase_codes], smc, 0.0)
+    smc = np.where(_SMC_PHASE_FLOOR_AT_ZERO[phase_codes] & (smc < 0), 0.0, smc)
+    result['SMC_Monthly'] = smc
 
     # Find exit date for reporting
-    exit_date = find_exit_date(result, SAFEGUARD_START_DATE)
-    result['Exit_FY'] = date_to_fy(exit_date) if exit_date else None
-
-    result['SMC_Cumulative'] = result['SMC_Monthly'].cumsum()
+    exit_fy = _find_exit_fy(fy_values, fy_scope1, SAFEGUARD_START_DATE)
+    result['Exit_FY'] = exit_fy
 
-    # Clean up temp column
-    result = result.drop(columns=['_fy'])
+    result['SMC_Cumulative'] = np.cumsum(smc, dtype=np.float64)
 
     return result
 
@@ -509,30 +526,133 @@ def calculate_safeguard_metrics(monthly, fsei_rom, fsei_elec, credit_start_date,
 # =============================================================================
 
 
+def _distribute_baseline_to_months(fy_codes, rom_t, site_mwh, hybrid_rom, hybrid_elec,
+                                   baseline, baseline_unfloored):
+    """Split annual baselines across months in proportion to production.
+
+    Per-FY inputs are indexed by fy_codes (0..K-1).  FY weight totals and
+    month counts come from np.bincount, and both baselines share one
+    weight vector.  An FY with no production is split evenly.
+
+    Returns:
+        tuple: (baseline, baseline_unfloored) monthly arrays
+    """
+    weight = (rom_t * hybrid_rom[fy_codes]) + (site_mwh * hybrid_elec[fy_codes])
+    n_fy = len(baseline)
+    total_weight = np.bincount(fy_codes, weights=weight, minlength=n_fy)
+    n_months = np.bincount(fy_codes, minlength=n_fy)
+
+    has_weight = total_weight > 0
+    safe_total = np.where(has_weight, total_weight, 1.0)
+    share = np.where(has_weight[fy_codes],
+                     weight / safe_total[fy_codes],
+                     1.0 / n_months[fy_codes])
+
+    return share * baseline[fy_codes], share * baseline_unfloored[fy_codes]
+
+
+# Low bits of a packed (Date, MatchKey) key that hold the MatchKey code
+_MATCH_CODE_BITS = 20
+
+
+def _superseded_by_actuals(budget, actuals, merge_col):
+    """Boolean mask of budget rows whose (Date, MatchKey) has actuals.
+
+    Dates must be the 1st of the month; NaT or mid-month dates raise
+    ValueError rather than silently mismatching.  Pairs are compared as
+    packed int64 keys (_pack_match_keys) when the MatchKey codes fit in
+    _MATCH_CODE_BITS, otherwise as a MultiIndex.
+    """
+    for frame in (actuals, budget):
+        dates = frame['Date']
+        if dates.isna().any():
+            raise ValueError("Actual/budget merge: Date contains NaT")
+        if (dates.dt.day != 1).any():
+            raise ValueError("Actual/budget merge: Date must be the 1st of the month")
+
+    actual_vals = actuals[merge_col].astype(str)
+    budget_vals = budget[merge_col].astype(str)
+    key_index = pd.Index(pd.concat([actual_vals, budget_vals]).unique())
+
+    if len(key_index) >= 1 << _MATCH_CODE_BITS:
+        # Too many MatchKeys to pack without the codes spilling into the month bits
+        actual_pairs = pd.MultiIndex.from_arrays([actuals['Date'], actual_vals])
+        budget_pairs = pd.MultiIndex.from_arrays([budget['Date'], budget_vals])
+        return budget_pairs.isin(actual_pairs)
+
+    actual_keys = _pack_match_keys(actuals['Date'], actual_vals, key_index)
+    budget_keys = _pack_match_keys(budget['Date'], budget_vals, key_index)
+    return np.isin(budget_keys, actual_keys)
+
+
+def _pack_match_keys(dates, match_keys, key_index):
+    """Pack (Date, MatchKey) pairs into single int64 keys for an anti-join.
+
+    Dates are the 1st of the month (checked by _superseded_by_actuals),
+    so months since epoch identify the Date exactly.  The month goes in
+    the high bits and the MatchKey's position in key_index in the low
+    _MATCH_CODE_BITS bits (caller ensures key_index fits), letting
+    np.isin() compare budget against actuals without Python tuples per row.
+    """
+    months = dates.values.astype('datetime64[M]').astype(np.int64)
+    codes = key_index.get_indexer(match_keys).astype(np.int64)
+    return (months << _MATCH_CODE_BITS) | codes
+
+
+def _escalated_schedule(fy_nums, start_fy, initial, escalation_rate):
+    """Price per row escalated annually from start_fy; zero before it.
+
+    (1 + rate) ** n is tabulated once for n = 0..max years and gathered by
+    years since start, so each call is one power table plus an index.
+
+    Returns:
+        (prices, active) - float ndarray and bool mask of rows >= start_fy
+    """
+    years = np.asarray(fy_nums) - start_fy
+    active = years >= 0
+    max_years = int(years.max()) if len(years) else -1
+    table = initial * np.power(1 + escalation_rate, np.arange(max(max_years, 0) + 1))
+    prices = np.where(active, table[np.clip(years, 0, None)], 0.0)
+    return prices, active
+
+
 def find_exit_date(monthly, safeguard_start_date):
     """Find first date when annual Scope 1 drops below 100,000 tCO2-e.
 
     Handles re-entry: if emissions bounce back above threshold, exit resets.
+    So the exit FY is the start of the below-threshold run that lasts to the
+    end of the projection, if there is one.
+
+    Args:
+        monthly: Monthly DataFrame with Date and Scope1_tCO2e (not modified)
+        safeguard_start_date: FYs before this date are ignored
     """
-    monthly['_fy_exit'] = monthly['Date'].apply(date_to_fy)
-    annual_scope1 = monthly.groupby('_fy_exit')['Scope1_tCO2e'].sum()
+    fys = dates_to_fy(monthly['Date'])
+    fy_values, fy_codes = np.unique(fys, return_inverse=True)
+    annual_scope1 = np.bincount(fy_codes, weights=monthly['Scope1_tCO2e'].values)
 
-    exit_fy = None
-    for fy in sorted(annual_scope1.index):
-        if fy < date_to_fy(safeguard_start_date):
-            continue
-        if annual_scope1[fy] < SAFEGUARD_THRESHOLD:
-            if exit_fy is None:
-                exit_fy = fy
-        else:
-            exit_fy = None  # Re-entry
+    exit_fy = _find_exit_fy(fy_values, annual_scope1, safeguard_start_date)
+    if exit_fy is None:
+        return None
+    exit_date, _ = fy_to_date_range(exit_fy)
+    return exit_date
 
-    monthly.drop(columns=['_fy_exit'], inplace=True)
 
-    if exit_fy:
-        exit_date, _ = fy_to_date_range(exit_fy)
-        return exit_date
-    return None
+def _find_exit_fy(fy_values, annual_scope1, safeguard_start_date):
+    """Exit FY from sorted unique FYs and their annual Scope 1 totals.
+
+    Shared by find_exit_date() and calculate_safeguard_metrics(), which
+    already holds the per-FY totals.  Returns an int FY or None.
+    """
+    in_scope = fy_values >= date_to_fy(safeguard_start_date)
+    fy_values = fy_values[in_scope]
+    below = annual_scope1[in_scope] < SAFEGUARD_THRESHOLD
+
+    # Below threshold in this FY and every FY after it
+    persistent = np.logical_and.accumulate(below[::-1])[::-1]
+    if not persistent.any():
+        return None
+    return int(fy_values[np.argmax(persistent)])
 
 
 # =============================================================================
@@ -578,67 +698,73 @@ def carbon_tax_analysis(projection, tax_start_fy, tax_rate_initial, tax_escalati
             Tax_S1_Cumulative, Tax_S2_Cumulative, Tax_Cumulative,
             Grid_MWh, NGA_EF2, S2_Cost_per_MWh
     """
-    result = projection.copy()
-    result['FY_num'] = result['Year'].str.extract(r'(\d+)')[0].astype(int)
+    # Derived columns are collected here and applied in one assign()
+    new = {}
+    if 'FY_num' in projection.columns:
+        fy_num = projection['FY_num'].values
+    else:
+        fy_num = new['FY_num'] = year_labels_to_int(projection['Year']).values
 
     # --- Tax rate schedule ---
-    result['Tax_Rate'] = 0.0
-    mask = result['FY_num'] >= tax_start_fy
-    years = result.loc[mask, 'FY_num'] - tax_start_fy
-    result.loc[mask, 'Tax_Rate'] = tax_rate_initial * ((1 + tax_escalation_rate) ** years)
+    tax_rate, mask = _escalated_schedule(
+        fy_num, tax_start_fy, tax_rate_initial, tax_escalation_rate
+    )
+    new['Tax_Rate'] = tax_rate
 
     # --- Grid electricity in MWh ---
-    if 'Grid_Electricity_MWh' in result.columns:
-        result['Grid_MWh'] = result['Grid_Electricity_MWh']
-    elif 'Grid_Electricity_kWh' in result.columns:
-        result['Grid_MWh'] = result['Grid_Electricity_kWh'] / 1000.0
+    if 'Grid_Electricity_MWh' in projection.columns:
+        grid_mwh = projection['Grid_Electricity_MWh'].values
+    elif 'Grid_Electricity_kWh' in projection.columns:
+        grid_mwh = projection['Grid_Electricity_kWh'].values / 1000.0
     else:
-        result['Grid_MWh'] = 0.0
+        grid_mwh = np.zeros(len(projection))
+    new['Grid_MWh'] = grid_mwh
 
     # --- NGA Scope 2 emission factor per year ---
     # kgCO2-e/kWh is numerically equal to tCO2-e/MWh
     # For years beyond last published NGA factor, apply annual decline rate
     # to reflect grid decarbonisation (renewables displacing fossil generation)
-    result['NGA_EF2'] = 0.0
+    nga_ef2 = np.zeros(len(projection))
     if nga_by_year is not None:
         last_nga_year = max(nga_by_year.available_years)
         base_ef2 = nga_by_year.get_electricity_factor(last_nga_year, state, 2)
-        for idx, row in result.iterrows():
-            fy = int(row['FY_num'])
+        fy_int = fy_num.astype(int)
+        # Use published NGA factor - one table lookup per distinct year,
+        # not per row, and none for years past the last publication
+        published = fy_int <= last_nga_year
+        for fy in np.unique(fy_int[published]).tolist():
             ef2 = nga_by_year.get_electricity_factor(fy, state, 2)
-            if ef2 is not None and fy <= last_nga_year:
-                # Use published NGA factor
-                result.at[idx, 'NGA_EF2'] = ef2
-            elif base_ef2 is not None and fy > last_nga_year:
-                # Decline from last published value
-                years_beyond = fy - last_nga_year
-                result.at[idx, 'NGA_EF2'] = base_ef2 * ((1 - ef2_decline_rate) ** years_beyond)
+            if ef2 is not None:
+                nga_ef2[fy_int == fy] = ef2
+        # Decline from last published value
+        if base_ef2 is not None:
+            years_beyond = fy_int[~published] - last_nga_year
+            nga_ef2[~published] = base_ef2 * ((1 - ef2_decline_rate) ** years_beyond)
+    new['NGA_EF2'] = nga_ef2
 
     # --- Scope 2 cost per MWh (rate × emission factor) ---
-    result['S2_Cost_per_MWh'] = result['Tax_Rate'] * result['NGA_EF2']
+    s2_cost = tax_rate * nga_ef2
+    new['S2_Cost_per_MWh'] = s2_cost
 
     # --- Scope 1 tax ---
-    result['Tax_S1_Annual'] = 0.0
-    result.loc[mask, 'Tax_S1_Annual'] = result.loc[mask, 'Scope1'] * result.loc[mask, 'Tax_Rate']
+    tax_s1 = np.where(mask, projection['Scope1'].values * tax_rate, 0.0)
+    new['Tax_S1_Annual'] = tax_s1
 
     # --- Scope 2 tax (electricity pass-through) ---
-    result['Tax_S2_Annual'] = 0.0
-    result.loc[mask, 'Tax_S2_Annual'] = (
-        result.loc[mask, 'Grid_MWh'] * result.loc[mask, 'S2_Cost_per_MWh']
-    )
+    tax_s2 = np.where(mask, grid_mwh * s2_cost, 0.0)
+    new['Tax_S2_Annual'] = tax_s2
 
     # --- Combined annual ---
-    result['Tax_Annual'] = result['Tax_S1_Annual'] + result['Tax_S2_Annual']
+    new['Tax_Annual'] = tax_s1 + tax_s2
 
     # --- Cumulative ---
-    result['Tax_S1_Cumulative'] = 0.0
-    result['Tax_S2_Cumulative'] = 0.0
-    result['Tax_Cumulative'] = 0.0
-    result.loc[mask, 'Tax_S1_Cumulative'] = result.loc[mask, 'Tax_S1_Annual'].cumsum()
-    result.loc[mask, 'Tax_S2_Cumulative'] = result.loc[mask, 'Tax_S2_Annual'].cumsum()
-    result.loc[mask, 'Tax_Cumulative'] = result.loc[mask, 'Tax_Annual'].cumsum()
+    # Pre-tax rows are already zero, so a plain running sum matches a
+    # cumsum over the taxed rows only
+    new['Tax_S1_Cumulative'] = np.where(mask, np.cumsum(tax_s1), 0.0)
+    new['Tax_S2_Cumulative'] = np.where(mask, np.cumsum(tax_s2), 0.0)
+    new['Tax_Cumulative'] = np.where(mask, np.cumsum(tax_s1 + tax_s2), 0.0)
 
-    return result
+    return projection.assign(**new)
 
 
 def apply_smc_transactions(projection, transactions):
@@ -659,7 +785,7 @@ def apply_smc_transactions(projection, transactions):
         return result
 
     if 'FY_num' not in result.columns:
-        result['FY_num'] = result['FY'].str.replace(r'^[A-Z]+', '', regex=True).astype(int)
+        result['FY_num'] = year_labels_to_int(result['FY'])
 
     # Issuances replace model-calculated SMC_Annual using reporting FY
     for fy, qty in transactions[transactions['Type'] == 'Issuance'].groupby('Applies_To_FY')['Quantity'].sum().items():
@@ -689,18 +815,17 @@ def smc_credit_value_analysis(projection, credit_start_fy, credit_price_initial,
     """
     result = projection.copy()
     if 'FY_num' not in result.columns:
-        result['FY_num'] = result['FY'].str.replace(r'^[A-Z]+', '', regex=True).astype(int)
+        result['FY_num'] = year_labels_to_int(result['FY'])
 
-    result['Credit_Price'] = 0.0
-    mask = result['FY_num'] >= credit_start_fy
-    years = result.loc[mask, 'FY_num'] - credit_start_fy
-    result.loc[mask, 'Credit_Price'] = credit_price_initial * ((1 + credit_escalation_rate) ** years)
+    credit_price, mask = _escalated_schedule(
+        result['FY_num'].values, credit_start_fy, credit_price_initial, credit_escalation_rate
+    )
+    result['Credit_Price'] = credit_price
 
-    result['Credit_Value_Annual'] = result['SMC_Annual'] * result['Credit_Price']
+    result['Credit_Value_Annual'] = result['SMC_Annual'].values * credit_price
 
-    result['Credit_Value_Cumulative'] = 0.0
-    result.loc[mask, 'Credit_Value_Cumulative'] = (
-        result.loc[mask, 'SMC_Cumulative'] * result.loc[mask, 'Credit_Price']
+    result['Credit_Value_Cumulative'] = np.where(
+        mask, result['SMC_Cumulative'].values * credit_price, 0.0
     )
 
     return result
\ No newline at end of file
@@ -11,9 +11,10 @@ ARCHITECTURE (v2):
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from CalcCalendar import date_to_fy, date_to_cy, period_filter
+from CalcCalendar import date_to_fy, date_to_cy, period_filter, period_mask
 from Config import DEFAULT_GRID_CONNECTION_DATE
 
 # Gold color palette
@@ -25,91 +26,151 @@ CAFE_NOIR = '#39250B'
 GRID_GREEN = '#2A9D8F'
 PHASE_MARKER = '#888888'
 
+# Sunburst department colours, assigned in descending-emissions order
+_DEPT_COLORS = (
+    GOLD_METALLIC, BRIGHT_GOLD, DARK_GOLDENROD, SEPIA, CAFE_NOIR,
+    '#D4A017', '#C9AE5D', '#B8860B', '#9B7653', '#8B7355',
+)
+# Shared layout for the cost centre / department Pareto charts
+_PARETO_LAYOUT = dict(height=500, showlegend=True,
+                      legend=dict(font=dict(size=10)),
+                      margin=dict(t=60, b=40, l=20, r=20))
+
 
 def _add_phase_markers(fig, years_list, grid_connected_date,
                        end_mining_date, end_processing_date, end_rehabilitation_date):
     """Add phase transition vertical lines and top-aligned labels to a chart."""
-    _GRID_GREEN = '#2A9D8F'
-    _PHASE_GREY = '#888888'
-    # Detect year type from label prefix
+    # Detect year type from label prefix; match on int year, plot on the label
     _is_fy = any(str(y).startswith('FY') for y in years_list)
-    markers = [
-        (grid_connected_date, "Grid Connection", _GRID_GREEN, "dot"),
-        (end_mining_date, "End Mining", _PHASE_GREY, "dash"),
-        (end_processing_date, "End Processing", _PHASE_GREY, "dash"),
-        (end_rehabilitation_date, "End Rehab", _PHASE_GREY, "dash"),
-    ]
-    years_set = set(str(y) for y in years_list)
+    to_year = date_to_fy if _is_fy else date_to_cy
+    year_labels = {int(str(y).lstrip('FCY')): str(y) for y in years_list}
+    markers = (
+        (grid_connected_date, "Grid Connection", GRID_GREEN, "dot"),
+        (end_mining_date, "End Mining", PHASE_MARKER, "dash"),
+        (end_processing_date, "End Processing", PHASE_MARKER, "dash"),
+        (end_rehabilitation_date, "End Rehab", PHASE_MARKER, "dash"),
+    )
+    shapes = []
+    annotations = []
     for i, (dt, label, colour, dash) in enumerate(markers):
         if dt is None:
             continue
-        yr = str(date_to_fy(dt)) if _is_fy else str(date_to_cy(dt))
-        if yr not in years_set:
+        yr = year_labels.get(to_year(dt))
+        if yr is None:
             continue
-        fig.add_shape(type="line", x0=yr, x1=yr, y0=0, y1=1, yref="paper",
-                     line=dict(color=colour, width=1.5, dash=dash))
-        fig.add_annotation(x=yr, y=1.0, yref="paper", text=label, showarrow=False,
-                          yshift=10 + i * 14, font=dict(size=9, color=colour))
+        shapes.append(dict(type="line", x0=yr, x1=yr, y0=0, y1=1, yref="paper",
+                           line=dict(color=colour, width=1.5, dash=dash)))
+        annotations.append(dict(x=yr, y=1.0, yref="paper", text=label, showarrow=False,
+                                yshift=10 + i * 14, font=dict(size=9, color=colour)))
+    # One layout update instead of a validation pass per shape/annotation
+    if shapes:
+        fig.update_layout(shapes=fig.layout.shapes + tuple(shapes),
+                          annotations=fig.layout.annotations + tuple(annotations))
+
+
+def _actual_mask(df):
+    """Boolean ndarray selecting DataSet == 'Actual' rows.
+
+    DataSet is categorical from the loader, so the test is a single
+    integer compare on the category codes; other dtypes fall back to
+    a plain equality.
+    """
+    dataset = df['DataSet']
+    if isinstance(dataset.dtype, pd.CategoricalDtype):
+        categories = dataset.cat.categories
+        if 'Actual' not in categories:
+            return np.zeros(len(df), dtype=bool)
+        return dataset.cat.codes.to_numpy() == categories.get_loc('Actual')
+    return (dataset == 'Actual').to_numpy()
 
 
-def _build_raw_data_summary(df, start_date, end_date):
-    """Build raw data summary table showing consumption and emissions by fuel type."""
+def _scope_totals_by(frame, key):
+    """Scope 1+2+3 emissions per value of key, largest first, positive only.
 
-    year_data = period_filter(df[df['DataSet'] == 'Actual'], start_date, end_date).copy()
+    The key is factorised once and each scope is summed with np.bincount,
+    avoiding the pandas groupby machinery for these small breakdowns.
+    NaN keys and NaN emissions are skipped, as groupby().sum() does.
 
-    if len(year_data) == 0:
-        return None
+    Returns:
+        (labels, totals) arrays
+    """
+    codes, uniques = pd.factorize(frame[key], sort=True)
+    valid = codes >= 0
+    total = np.zeros(len(uniques))
+    for col in ('Scope1_tCO2e', 'Scope2_tCO2e', 'Scope3_tCO2e'):
+        weights = np.nan_to_num(frame[col].to_numpy(dtype='float64')[valid])
+        total += np.bincount(codes[valid], weights=weights, minlength=len(uniques))
+    keep = np.flatnonzero(total > 0)
+    order = keep[np.argsort(-total[keep], kind='stable')]
+    return np.asarray(uniques)[order], total[order]
+
+
+def _fmt_series(values):
+    """Format numbers by magnitude: <1 to 4 dp, <100 to 2 dp, else 0 dp.
+
+    Blank for NaN or non-numeric.  Each magnitude band is formatted with
+    one bound format method, rather than per-cell apply() dispatch.
+    """
+    a = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype='float64')
+    mag = np.abs(a)
+    out = np.full(len(a), '', dtype=object)
+    for band, fmt in ((mag < 1, '{:,.4f}'.format),
+                      ((mag >= 1) & (mag < 100), '{:,.2f}'.format),
+                      (mag >= 100, '{:,.0f}'.format)):
+        out[band] = [fmt(v) for v in a[band]]
+    return out
 
-    has_fuel = year_data['NGAFuel'].notna() & (year_data['NGAFuel'] != '')
-    year_data = year_data[has_fuel]
-    if len(year_data) == 0:
-        return None
 
-    agg_cols = {
-        'Quantity': 'sum',
-        'Scope1_tCO2e': 'sum',
-        'Scope2_tCO2e': 'sum',
-        'Scope3_tCO2e': 'sum',
-        'UOM': 'first',
-    }
-    if 'Energy_GJ' in year_data.columns:
-        agg_cols['Energy_GJ'] = 'sum'
-    summary = year_data.groupby('Description').agg(agg_cols).reset_index()
+def _build_raw_data_summary(period_actuals):
+    """Build raw data summary table showing consumption and emissions by fuel type.
 
-    summary['_total'] = summary[['Scope1_tCO2e', 'Scope2_tCO2e', 'Scope3_tCO2e']].sum(axis=1)
-    summary = summary.sort_values('_total', ascending=False).drop(columns=['_total'])
+    Args:
+        period_actuals: Actual rows already filtered to the display period
+    """
+    df = period_actuals
+
+    # Rows with an NGA fuel, selected with the needed columns in one copy
+    mask = (df['NGAFuel'].notna() & (df['NGAFuel'] != '')).values
+    if not mask.any():
+        return None
 
     emission_cols = ['Scope1_tCO2e', 'Scope2_tCO2e', 'Scope3_tCO2e']
-    summary = summary[summary[emission_cols].abs().sum(axis=1) > 0]
+    sum_cols = ['Quantity'] + emission_cols
+    if 'Energy_GJ' in df.columns:
+        sum_cols.append('Energy_GJ')
+    year_data = df.loc[mask, ['Description', 'UOM'] + sum_cols]
+
+    # Numeric sums on the fast groupby path; UOM is the first non-null
+    # value per description, taken separately rather than via agg('first')
+    summary = year_data.groupby('Description', observed=True)[sum_cols].sum()
+    uom = (
+        year_data[['Description', 'UOM']].dropna(subset=['UOM'])
+        .drop_duplicates('Description').set_index('Description')['UOM']
+    )
+    summary = summary.assign(UOM=uom.reindex(summary.index))
+
+    # Largest total first; drop descriptions with no emissions
+    totals = np.nansum(summary[emission_cols].to_numpy(), axis=1)
+    order = np.argsort(-totals, kind='stable')
+    summary = summary.iloc[order]
+    summary = summary[np.nansum(np.abs(summary[emission_cols].to_numpy()), axis=1) > 0]
     if len(summary) == 0:
         return None
 
-    summary['Energy (GJ)'] = summary['Energy_GJ'] if 'Energy_GJ' in summary.columns else 0
-
+    # Description stays the group index; columns are taken as arrays
     result = pd.DataFrame({
-        'Description': summary['Description'],
-        'UOM': summary['UOM'],
-        'Quantity': summary['Quantity'],
-        'Energy (GJ)': summary['Energy (GJ)'],
-        'Scope 1 (tCO2-e)': summary['Scope1_tCO2e'],
-        'Scope 2 (tCO2-e)': summary['Scope2_tCO2e'],
-        'Scope 3 (tCO2-e)': summary['Scope3_tCO2e'],
+        'Description': summary.index,
+        'UOM': summary['UOM'].to_numpy(),
+        'Quantity': summary['Quantity'].to_numpy(),
+        'Energy (GJ)': summary['Energy_GJ'].to_numpy() if 'Energy_GJ' in summary.columns else 0,
+        'Scope 1 (tCO2-e)': summary['Scope1_tCO2e'].to_numpy(),
+        'Scope 2 (tCO2-e)': summary['Scope2_tCO2e'].to_numpy(),
+        'Scope 3 (tCO2-e)': summary['Scope3_tCO2e'].to_numpy(),
     })
 
-    def _fmt(x):
-        if pd.isna(x) or not isinstance(x, (int, float)):
-            return ''
-        if abs(x) < 1:
-            return f"{x:,.4f}"
-        elif abs(x) < 100:
-            return f"{x:,.2f}"
-        return f"{x:,.0f}"
-
-    result['Quantity'] = result['Quantity'].apply(_fmt)
-    result['Energy (GJ)'] = result['Energy (GJ)'].apply(_fmt)
-    result['Scope 1 (tCO2-e)'] = result['Scope 1 (tCO2-e)'].apply(_fmt)
-    result['Scope 2 (tCO2-e)'] = result['Scope 2 (tCO2-e)'].apply(_fmt)
-    result['Scope 3 (tCO2-e)'] = result['Scope 3 (tCO2-e)'].apply(_fmt)
+    for col in ['Quantity', 'Energy (GJ)', 'Scope 1 (tCO2-e)',
+                'Scope 2 (tCO2-e)', 'Scope 3 (tCO2-e)']:
+        result[col] = _fmt_series(result[col])
 
     return result
 
@@ -173,6 +234,96 @@ def _build_monthly_detail(df, start_date, end_date):
     return result
 
 
+# Every raw-frame column read by the cached builders (including the
+# actual/period filter feeding _build_raw_data_summary); _frame_key hashes them all
+_FRAME_KEY_COLUMNS = [
+    'Date', 'DataSet', 'Quantity', 'CommonName', 'RowType',
+    'NGAFuel', 'Description', 'UOM',
+    'Scope1_tCO2e', 'Scope2_tCO2e', 'Scope3_tCO2e', 'Energy_GJ',
+]
+
+def _frame_key(df):
+    """Content fingerprint of a raw DataFrame, used as a cache key.
+
+    Hashes every column in _FRAME_KEY_COLUMNS; computed once per render
+    and shared by the cached builders.
+    """
+    cols = [c for c in _FRAME_KEY_COLUMNS if c in df.columns]
+    return (len(df), tuple(cols),
+            int(pd.util.hash_pandas_object(df[cols], index=False).sum()))
+
+
+@st.cache_data(show_spinner=False)
+def _cached_raw_data_summary(df_key, start_date, end_date, _period_actuals):
+    """Cached _build_raw_data_summary().
+
+    _period_actuals is not hashed; it is the actual rows of the raw
+    frame within the period, so df_key (from _frame_key, which covers
+    DataSet, Date and every column the builder reads) and the period
+    bounds determine it.
+    """
+    return _build_raw_data_summary(_period_actuals)
+
+
+def _build_intensity_table(df, projection, end_mining_date):
+    """Gold (tCO2-e/oz) and ROM (tCO2-e/t) intensity per projection year.
+
+    Gold recovered (oz) from raw df - deduplicated actual/budget.
+    """
+    _is_fy = projection['FY'].iloc[0].startswith('FY') if len(projection) > 0 else True
+    _end_mining_yr = date_to_fy(end_mining_date) if _is_fy else date_to_cy(end_mining_date)
+    _gold_intensity = []
+    for _, row in projection.iterrows():
+        fy_label = row['FY']
+        # Use Date column from annual frame to derive period range
+        _period_start = pd.Timestamp(row['Date'])
+        if _is_fy:
+            _period_end = _period_start + pd.DateOffset(years=1)
+        else:
+            _period_end = _period_start + pd.DateOffset(years=1)
+        fy_raw = period_filter(df, _period_start, _period_end)
+
+        # Deduplicate: prefer actuals over budget for overlapping months
+        gold_oz = 0
+        if 'CommonName' in fy_raw.columns:
+            gold_mask = fy_raw['CommonName'].astype(str) == 'Gold recovered'
+            if 'RowType' in fy_raw.columns:
+                gold_mask = gold_mask & (fy_raw['RowType'].astype(str) == 'production')
+            gold_rows = fy_raw.loc[gold_mask].copy()
+            if len(gold_rows) > 0 and 'DataSet' in gold_rows.columns:
+                gold_rows['_month'] = gold_rows['Date'].dt.to_period('M')
+                is_actual = _actual_mask(gold_rows)
+                actual_months = set(gold_rows.loc[is_actual, '_month'])
+                gold_rows = gold_rows[
+                    is_actual |
+                    (~gold_rows['_month'].isin(actual_months))
+                ]
+                gold_oz = gold_rows['Quantity'].sum()
+
+        total_e = row['Scope1'] + row['Scope2'] + row['Scope3']
+        fy_num = int(fy_label.replace('FY', '').replace('CY', ''))
+        gold_int = total_e / gold_oz if gold_oz > 0 and total_e > 0 else None
+        _gold_intensity.append({
+            'FY': fy_label,
+            'Gold_oz': gold_oz,
+            'Gold_Intensity': gold_int,
+            'ROM_Intensity': total_e / (row['ROM_Mt'] * 1e6) if row['ROM_Mt'] > 0 and fy_num < _end_mining_yr else None
+        })
+
+    return pd.DataFrame(_gold_intensity)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_intensity_table(df_key, _df, projection, end_mining_date):
+    """Cached _build_intensity_table().
+
+    _df is underscore-prefixed so Streamlit does not hash it; df_key
+    (from _frame_key, covering every column read here) stands in for it.  The projection is small and
+    hashed directly.
+    """
+    return _build_intensity_table(_df, projection, end_mining_date)
+
+
 def render_ghg_tab(df, precomputed, projection,
                    start_date=None, end_date=None, period_label='',
                    end_mining_date=None, end_processing_date=None,
@@ -197,8 +348,8 @@ def render_ghg_tab(df, precomputed, projection,
     st.caption(f"Mining ends {_em_str} | Processing ends {_ep_str}")
 
     # Show data info
-    actual_count = len(df[df['DataSet'] == 'Actual'])
-    source_data = df[df['DataSet'] == 'Actual']
+    source_data = df[_actual_mask(df)]
+    actual_count = len(source_data)
 
     if len(source_data) > 0:
         date_min = source_data['Date'].min()
@@ -224,6 +375,11 @@ def display_single_source(projection, df, show_summary=True,
 
     year_label = period_label
 
+    # Actual rows for the display period, filtered once and shared by the
+    # breakdown charts, the sunburst and the fuel consumption summary
+    period_actuals = df.loc[_actual_mask(df) & period_mask(df, start_date, end_date)]
+    df_key = _frame_key(df)
+
     # Summary table
     if show_summary:
         with st.expander("Emissions Summary", expanded=True):
@@ -248,50 +404,35 @@ def display_single_source(projection, df, show_summary=True,
     # Charts
     with st.expander("Emissions Charts", expanded=True):
 
-        projection_display = projection.copy()
-        projection_display['Year'] = projection_display['FY'].str.replace(r'^[A-Z]+', '', regex=True)
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=projection_display['Year'],
-            y=projection_display['Scope1'],
-            name='Scope 1',
-            mode='lines',
-            fill='tonexty',
-            line=dict(color=GOLD_METALLIC, width=2),
-            stackgroup='one'
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=projection_display['Year'],
-            y=projection_display['Scope2'],
-            name='Scope 2',
-            mode='lines',
-            fill='tonexty',
-            line=dict(color=BRIGHT_GOLD, width=2),
-            stackgroup='one'
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=projection_display['Year'],
-            y=projection_display['Scope3'],
-            name='Scope 3',
-            mode='lines',
-            fill='tonexty',
-            line=dict(color=DARK_GOLDENROD, width=2),
-            stackgroup='one'
-        ))
-
-        fig.update_layout(
-            title="Total GHG Emissions by Scope",
-            xaxis_title="Year",
-            yaxis_title="Emissions (tCO2-e)",
-            hovermode='x unified',
-            height=500
+        # Axis labels without the FY/CY prefix ("FY2024" -> "2024"); labels
+        # are fixed-width so a slice replaces the regex and the frame copy
+        year_axis = projection['FY'].str[2:]
+
+        fig = go.Figure(
+            data=[
+                go.Scatter(
+                    x=year_axis,
+                    y=projection[col],
+                    name=name,
+                    mode='lines',
+                    fill='tonexty',
+                    line=dict(color=colour, width=2),
+                    stackgroup='one'
+                )
+                for col, name, colour in (('Scope1', 'Scope 1', GOLD_METALLIC),
+                                          ('Scope2', 'Scope 2', BRIGHT_GOLD),
+                                          ('Scope3', 'Scope 3', DARK_GOLDENROD))
+            ],
+            layout=dict(
+                title="Total GHG Emissions by Scope",
+                xaxis_title="Year",
+                yaxis_title="Emissions (tCO2-e)",
+                hovermode='x unified',
+                height=500
+            )
         )
 
-        _add_phase_markers(fig, projection_display['Year'].tolist(),
+        _add_phase_markers(fig, year_axis.tolist(),
                           grid_connected_date, end_mining_date, end_processing_date,
                           end_rehabilitation_date)
 
@@ -301,7 +442,7 @@ def display_single_source(projection, df, show_summary=True,
     with st.expander("Emissions Breakdown", expanded=False):
         st.caption(f"Breakdown for {year_label}")
 
-        fy_data = period_filter(df[df['DataSet'] == 'Actual'], start_date, end_date).copy()
+        fy_data = period_actuals
 
         if len(fy_data) == 0:
             st.warning(f"No data available for {year_label}")
@@ -309,58 +450,44 @@ def display_single_source(projection, df, show_summary=True,
             col1, col2 = st.columns(2)
 
             with col1:
-                cc_emissions = fy_data.groupby('CostCentre', observed=False).agg({
-                    'Scope1_tCO2e': 'sum', 'Scope2_tCO2e': 'sum', 'Scope3_tCO2e': 'sum'
-                }).reset_index()
-                cc_emissions['Total'] = cc_emissions['Scope1_tCO2e'] + cc_emissions['Scope2_tCO2e'] + cc_emissions['Scope3_tCO2e']
-                cc_emissions = cc_emissions[cc_emissions['Total'] > 0]
-                cc_emissions = cc_emissions.sort_values('Total', ascending=False).reset_index(drop=True)
-                cc_emissions['Cumulative_Pct'] = cc_emissions['Total'].cumsum() / cc_emissions['Total'].sum() * 100
+                cc_labels, cc_totals = _scope_totals_by(fy_data, 'CostCentre')
+                cc_cum_pct = np.cumsum(cc_totals) / cc_totals.sum() * 100
 
                 fig_cc = make_subplots(specs=[[{"secondary_y": True}]])
                 fig_cc.add_trace(go.Bar(
-                    x=cc_emissions['CostCentre'], y=cc_emissions['Total'],
+                    x=cc_labels, y=cc_totals,
                     name='Emissions (tCO2-e)',
                     marker_color=GOLD_METALLIC
                 ), secondary_y=False)
                 fig_cc.add_trace(go.Scatter(
-                    x=cc_emissions['CostCentre'], y=cc_emissions['Cumulative_Pct'],
+                    x=cc_labels, y=cc_cum_pct,
                     name='Cumulative %', mode='lines+markers',
                     line=dict(color=CAFE_NOIR, width=2),
                     marker=dict(size=5, color=CAFE_NOIR)
                 ), secondary_y=True)
-                fig_cc.update_layout(title="By Cost Centre", height=500, showlegend=True,
-                                    legend=dict(font=dict(size=10)),
-                                    margin=dict(t=60, b=40, l=20, r=20))
+                fig_cc.update_layout(title="By Cost Centre", **_PARETO_LAYOUT)
                 fig_cc.update_yaxes(title_text="Emissions (tCO2-e)", secondary_y=False)
                 fig_cc.update_yaxes(title_text="Cumulative %", range=[0, 105], secondary_y=True)
                 fig_cc.update_xaxes(tickangle=-45)
                 st.plotly_chart(fig_cc, width="stretch", key="pareto_cc")
 
             with col2:
-                dept_emissions = fy_data.groupby('Department', observed=False).agg({
-                    'Scope1_tCO2e': 'sum', 'Scope2_tCO2e': 'sum', 'Scope3_tCO2e': 'sum'
-                }).reset_index()
-                dept_emissions['Total'] = dept_emissions['Scope1_tCO2e'] + dept_emissions['Scope2_tCO2e'] + dept_emissions['Scope3_tCO2e']
-                dept_emissions = dept_emissions[dept_emissions['Total'] > 0]
-                dept_emissions = dept_emissions.sort_values('Total', ascending=False).reset_index(drop=True)
-                dept_emissions['Cumulative_Pct'] = dept_emissions['Total'].cumsum() / dept_emissions['Total'].sum() * 100
+                dept_labels, dept_totals = _scope_totals_by(fy_data, 'Department')
+                dept_cum_pct = np.cumsum(dept_totals) / dept_totals.sum() * 100
 
                 fig_dept = make_subplots(specs=[[{"secondary_y": True}]])
                 fig_dept.add_trace(go.Bar(
-                    x=dept_emissions['Department'], y=dept_emissions['Total'],
+                    x=dept_labels, y=dept_totals,
                     name='Emissions (tCO2-e)',
                     marker_color=GOLD_METALLIC
                 ), secondary_y=False)
                 fig_dept.add_trace(go.Scatter(
-                    x=dept_emissions['Department'], y=dept_emissions['Cumulative_Pct'],
+                    x=dept_labels, y=dept_cum_pct,
                     name='Cumulative %', mode='lines+markers',
                     line=dict(color=CAFE_NOIR, width=2),
                     marker=dict(size=5, color=CAFE_NOIR)
                 ), secondary_y=True)
-                fig_dept.update_layout(title="By Department", height=500, showlegend=True,
-                                      legend=dict(font=dict(size=10)),
-                                      margin=dict(t=60, b=40, l=20, r=20))
+                fig_dept.update_layout(title="By Department", **_PARETO_LAYOUT)
                 fig_dept.update_yaxes(title_text="Emissions (tCO2-e)", secondary_y=False)
                 fig_dept.update_yaxes(title_text="Cumulative %", range=[0, 105], secondary_y=True)
                 fig_dept.update_xaxes(tickangle=-45)
@@ -370,7 +497,7 @@ def display_single_source(projection, df, show_summary=True,
     with st.expander("Emissions by Department & Cost Centre", expanded=False):
         st.caption(f"Emissions breakdown for {year_label} (actuals)")
 
-        sun_data = period_filter(df[df['DataSet'] == 'Actual'], start_date, end_date).copy()
+        sun_data = period_actuals.copy()
 
         if len(sun_data) == 0 or 'Department' not in sun_data.columns or 'CostCentre' not in sun_data.columns:
             st.warning(f"No data available for {year_label}")
@@ -378,7 +505,10 @@ def display_single_source(projection, df, show_summary=True,
             sun_data['Total'] = (
                 sun_data['Scope1_tCO2e'] + sun_data['Scope2_tCO2e'] + sun_data['Scope3_tCO2e']
             )
-            sun_grouped = sun_data.groupby(['Department', 'CostCentre'], observed=False)['Total'].sum().reset_index()
+            sun_grouped = (
+                sun_data[['Department', 'CostCentre', 'Total']]
+                .groupby(['Department', 'CostCentre'], observed=True, sort=False)['Total'].sum().reset_index()
+            )
             sun_grouped = sun_grouped[sun_grouped['Total'] > 0].sort_values('Total', ascending=False)
 
             if len(sun_grouped) > 0:
@@ -386,15 +516,16 @@ def display_single_source(projection, df, show_summary=True,
                 _dept_threshold_pct = 2  # Departments below this % are bucketed into "Other"
 
                 # Consolidate small departments into "Other"
-                dept_totals = sun_grouped.groupby('Department')['Total'].sum().sort_values(ascending=False)
-                major_depts = dept_totals[dept_totals / grand_total * 100 >= _dept_threshold_pct].index.tolist()
-                minor_depts = dept_totals[dept_totals / grand_total * 100 < _dept_threshold_pct].index.tolist()
-
-                if minor_depts:
-                    sun_grouped['Department'] = sun_grouped['Department'].apply(
-                        lambda d: d if d in major_depts else 'Other'
+                dept_totals = sun_grouped.groupby('Department', observed=True, sort=False)['Total'].sum()
+                is_minor = (dept_totals / grand_total * 100 < _dept_threshold_pct).to_numpy()
+
+                if is_minor.any():
+                    dept_col = sun_grouped['Department'].astype(object)
+                    sun_grouped = (
+                        sun_grouped
+                        .assign(Department=dept_col.where(~dept_col.isin(dept_totals.index[is_minor]), 'Other'))
+                        .groupby(['Department', 'CostCentre'], as_index=False, observed=True, sort=False)['Total'].sum()
                     )
-                    sun_grouped = sun_grouped.groupby(['Department', 'CostCentre'], as_index=False)['Total'].sum()
                     sun_grouped = sun_grouped[sun_grouped['Total'] > 0].sort_values('Total', ascending=False)
 
                 # Build sunburst: Department (inner) -> Cost Centre (outer)
@@ -404,18 +535,16 @@ def display_single_source(projection, df, show_summary=True,
                 sun_values = []
                 sun_colors = []
 
-                dept_color_map = {}
-                dept_colors = [
-                    GOLD_METALLIC, BRIGHT_GOLD, DARK_GOLDENROD, SEPIA, CAFE_NOIR,
-                    '#D4A017', '#C9AE5D', '#B8860B', '#9B7653', '#8B7355',
-                ]
-                dept_order = sun_grouped.groupby('Department')['Total'].sum().sort_values(ascending=False).index.tolist()
-                for i, d in enumerate(dept_order):
-                    dept_color_map[d] = dept_colors[i % len(dept_colors)]
+                dept_sums = (
+                    sun_grouped.groupby('Department', observed=True, sort=False)['Total'].sum()
+                    .sort_values(ascending=False)
+                )
+                dept_color_map = {
+                    d: _DEPT_COLORS[i % len(_DEPT_COLORS)] for i, d in enumerate(dept_sums.index)
+                }
 
                 # Inner ring: Departments
-                for d in dept_order:
-                    d_total = sun_grouped[sun_grouped['Department'] == d]['Total'].sum()
+                for d, d_total in dept_sums.items():
                     pct = d_total / grand_total * 100
                     sun_ids.append(d)
                     sun_labels.append(f"{d}<br>{pct:.0f}%")
@@ -478,7 +607,7 @@ def display_single_source(projection, df, show_summary=True,
 
                 with col_tbl:
                     # Department summary table
-                    _dept_sums = sun_data.groupby('Department', observed=False)['Total'].sum().sort_values(ascending=False)
+                    _dept_sums = sun_data.groupby('Department', observed=True, sort=False)['Total'].sum().sort_values(ascending=False)
                     _dept_sums = _dept_sums[_dept_sums > 0]
 
                     tbl_rows = []
@@ -501,47 +630,9 @@ def display_single_source(projection, df, show_summary=True,
         st.caption("Total emissions intensity - actuals and budget (full lifecycle)")
 
         # Calculate gold intensity per year across full projection
-        # Gold recovered (oz) from raw df - deduplicated actual/budget
+        # (cached: only changes when the data or projection changes)
         _is_fy = projection['FY'].iloc[0].startswith('FY') if len(projection) > 0 else True
-        _end_mining_yr = date_to_fy(end_mining_date) if _is_fy else date_to_cy(end_mining_date)
-        _gold_intensity = []
-        for _, row in projection.iterrows():
-            fy_label = row['FY']
-            # Use Date column from annual frame to derive period range
-            _period_start = pd.Timestamp(row['Date'])
-            if _is_fy:
-                _period_end = _period_start + pd.DateOffset(years=1)
-            else:
-                _period_end = _period_start + pd.DateOffset(years=1)
-            fy_raw = period_filter(df, _period_start, _period_end)
-
-            # Deduplicate: prefer actuals over budget for overlapping months
-            gold_oz = 0
-            if 'CommonName' in fy_raw.columns:
-                gold_mask = fy_raw['CommonName'].astype(str) == 'Gold recovered'
-                if 'RowType' in fy_raw.columns:
-                    gold_mask = gold_mask & (fy_raw['RowType'].astype(str) == 'production')
-                gold_rows = fy_raw.loc[gold_mask].copy()
-                if len(gold_rows) > 0 and 'DataSet' in gold_rows.columns:
-                    gold_rows['_month'] = gold_rows['Date'].dt.to_period('M')
-                    actual_months = set(gold_rows.loc[gold_rows['DataSet'] == 'Actual', '_month'])
-                    gold_rows = gold_rows[
-                        (gold_rows['DataSet'] == 'Actual') |
-                        (~gold_rows['_month'].isin(actual_months))
-                    ]
-                    gold_oz = gold_rows['Quantity'].sum()
-
-            total_e = row['Scope1'] + row['Scope2'] + row['Scope3']
-            fy_num = int(fy_label.replace('FY', '').replace('CY', ''))
-            gold_int = total_e / gold_oz if gold_oz > 0 and total_e > 0 else None
-            _gold_intensity.append({
-                'FY': fy_label,
-                'Gold_oz': gold_oz,
-                'Gold_Intensity': gold_int,
-                'ROM_Intensity': total_e / (row['ROM_Mt'] * 1e6) if row['ROM_Mt'] > 0 and fy_num < _end_mining_yr else None
-            })
-
-        intensity_df = pd.DataFrame(_gold_intensity)
+        intensity_df = _cached_intensity_table(df_key, df, projection, end_mining_date)
 
         if len(intensity_df) > 0:
             fig_int = make_subplots(specs=[[{"secondary_y": True}]])
@@ -558,7 +649,6 @@ def display_single_source(projection, df, show_summary=True,
                 ), secondary_y=False)
 
                 # Linear trend line for gold intensity (target trajectory)
-                import numpy as np
                 _gx = np.arange(len(gold_valid))
                 _gy = gold_valid['Gold_Intensity'].values
                 _coeffs = np.polyfit(_gx, _gy, 1)
@@ -640,19 +730,19 @@ def display_single_source(projection, df, show_summary=True,
 
     if df is not None:
         with st.expander(f"\U0001f4cb Fuel Consumption Detail ({year_label})", expanded=False):
-            raw_table = _build_raw_data_summary(df, start_date, end_date)
+            raw_table = _cached_raw_data_summary(df_key, start_date, end_date, period_actuals)
             if raw_table is not None:
                 st.dataframe(raw_table, hide_index=True, width="stretch")
             else:
                 st.info(f"No actual data for {year_label}")
 
     with st.expander("Emissions Data Table", expanded=False):
-        display_df = projection[['FY', 'Phase', 'ROM_Mt', 'Scope1', 'Scope2', 'Scope3', 'Total']].copy()
-        display_df['ROM_Mt'] = display_df['ROM_Mt'].apply(lambda x: f"{x:.2f}")
-        display_df['Scope1'] = display_df['Scope1'].apply(lambda x: f"{x:,.0f}")
-        display_df['Scope2'] = display_df['Scope2'].apply(lambda x: f"{x:,.0f}")
-        display_df['Scope3'] = display_df['Scope3'].apply(lambda x: f"{x:,.0f}")
-        display_df['Total'] = display_df['Total'].apply(lambda x: f"{x:,.0f}")
+        fmt_int = '{:,.0f}'.format
+        display_df = projection[['FY', 'Phase']].assign(
+            ROM_Mt=['{:.2f}'.format(v) for v in projection['ROM_Mt'].to_numpy()],
+            **{col: [fmt_int(v) for v in projection[col].to_numpy()]
+               for col in ('Scope1', 'Scope2', 'Scope3', 'Total')},
+        )
 
         st.dataframe(display_df, hide_index=True, width="stretch", height=400)
 
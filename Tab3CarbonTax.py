@@ -15,11 +15,46 @@ same x position (not side-by-side).
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from CalcPrecompute import build_carbon_tax_projection
-from CalcCalendar import date_to_fy
-from Config import DEFAULT_GRID_CONNECTION_DATE, DEFAULT_EF2_DECLINE_RATE
+from Config import DEFAULT_EF2_DECLINE_RATE, WEBGL_MIN_POINTS
+
+# Pastel palette
+GOLD_METALLIC = '#DBB12A'
+S1_COLOR = '#CA564B'       # Warm red-brown (tax = cost)
+S2_COLOR = '#D4A084'       # Dusty peach (electricity pass-through)
+CONNECTOR = 'rgba(138, 126, 107, 0.4)'
+
+# Above this many bars, waterfall value labels are thinned to the larger amounts
+_MAX_LABELLED_BARS = 30
+
+# Columns the tab reads from the carbon tax projection
+_TAX_COLUMNS = ['FY', 'FY_num', 'Scope1', 'Grid_MWh', 'NGA_EF2', 'Tax_Rate',
+                'S2_Cost_per_MWh', 'Tax_S1_Annual', 'Tax_S2_Annual', 'Tax_Annual',
+                'Tax_S1_Cumulative', 'Tax_S2_Cumulative', 'Tax_Cumulative']
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_carbon_tax_projection(data_frame, _precomputed, tax_start_fy, tax_rate,
+                                  tax_escalation, include_scope2):
+    """Cached build_carbon_tax_projection().
+
+    data_frame and the scalar tax settings form the key; _precomputed is
+    not hashed (only its NGA factor lookup is read, which is fixed for the
+    loaded data set).  display_year is not an argument, so reruns that only
+    change the selected year reuse the cached result.
+
+    Only _TAX_COLUMNS are kept, so the cache entry (and the copy handed
+    back on each hit) does not carry the full annual frame.
+    """
+    carbon_tax = build_carbon_tax_projection(
+        data_frame, _precomputed,
+        tax_start_fy=tax_start_fy, tax_rate=tax_rate, tax_escalation=tax_escalation,
+        include_scope2=include_scope2,
+        ef2_decline_rate=DEFAULT_EF2_DECLINE_RATE
+    )
+    return carbon_tax[[c for c in _TAX_COLUMNS if c in carbon_tax.columns]]
 
 
 def render_carbon_tax_tab(precomputed, data_frame,
@@ -50,81 +85,296 @@ def render_carbon_tax_tab(precomputed, data_frame,
     )
 
     # \u2500\u2500 Build carbon tax analysis from pre-computed data (lightweight) \u2500\u2500
-    carbon_tax = build_carbon_tax_projection(
-        data_frame, precomputed,
-        tax_start_fy=tax_start_fy, tax_rate=tax_rate, tax_escalation=tax_escalation,
-        include_scope2=include_scope2,
-        ef2_decline_rate=DEFAULT_EF2_DECLINE_RATE
+    carbon_tax = _cached_carbon_tax_projection(
+        data_frame, precomputed, tax_start_fy, tax_rate, tax_escalation, include_scope2
     )
 
-    display_tax_single(carbon_tax, tax_start_fy, period_label=period_label)
+    # Tax-period rows, filtered once for the summary, chart and data table
+    tax_period = carbon_tax.loc[carbon_tax['FY_num'] >= tax_start_fy]
+
+    display_tax_single(tax_period, tax_start_fy, period_label=period_label)
 
     # Data Table
     with st.expander("Tax Data Table", expanded=False):
-        tax_period = carbon_tax[carbon_tax['FY_num'] >= tax_start_fy].copy()
         if len(tax_period) > 0:
             display_cols = ['FY', 'Scope1', 'Grid_MWh', 'NGA_EF2',
                            'Tax_Rate', 'S2_Cost_per_MWh',
                            'Tax_S1_Annual', 'Tax_S2_Annual', 'Tax_Annual',
                            'Tax_Cumulative']
             display_cols = [c for c in display_cols if c in tax_period.columns]
-            display_df = tax_period[display_cols].copy()
-
-            fmt_map = {
-                'Scope1': lambda x: f"{x:,.0f}",
-                'Grid_MWh': lambda x: f"{x:,.0f}",
-                'NGA_EF2': lambda x: f"{x:.4f}",
-                'Tax_Rate': lambda x: f"${x:.2f}",
-                'S2_Cost_per_MWh': lambda x: f"${x:.2f}",
-                'Tax_S1_Annual': lambda x: f"${x:,.0f}",
-                'Tax_S2_Annual': lambda x: f"${x:,.0f}",
-                'Tax_Annual': lambda x: f"${x:,.0f}",
-                'Tax_Cumulative': lambda x: f"${x:,.0f}",
+
+            # (display label, format) per column; one list comp per column on
+            # the raw values instead of Series.apply plus a separate rename
+            formats = {
+                'Scope1': ('Scope 1 tCO2-e', '{:,.0f}'),
+                'Grid_MWh': ('Grid MWh', '{:,.0f}'),
+                'NGA_EF2': ('NGA EF2 (t/MWh)', '{:.4f}'),
+                'Tax_Rate': ('Tax Rate', '${:.2f}'),
+                'S2_Cost_per_MWh': ('S2 $/MWh', '${:.2f}'),
+                'Tax_S1_Annual': ('S1 Tax $', '${:,.0f}'),
+                'Tax_S2_Annual': ('S2 Tax $', '${:,.0f}'),
+                'Tax_Annual': ('Annual Tax $', '${:,.0f}'),
+                'Tax_Cumulative': ('Cumulative Tax $', '${:,.0f}'),
             }
-            for col, fn in fmt_map.items():
-                if col in display_df.columns:
-                    display_df[col] = display_df[col].apply(fn)
-
-            display_df = display_df.rename(columns={
-                'FY': 'FY', 'Scope1': 'Scope 1 tCO2-e',
-                'Grid_MWh': 'Grid MWh', 'NGA_EF2': 'NGA EF2 (t/MWh)',
-                'Tax_Rate': 'Tax Rate', 'S2_Cost_per_MWh': 'S2 $/MWh',
-                'Tax_S1_Annual': 'S1 Tax $', 'Tax_S2_Annual': 'S2 Tax $',
-                'Tax_Annual': 'Annual Tax $', 'Tax_Cumulative': 'Cumulative Tax $',
-            })
+            table = {}
+            for c in display_cols:
+                values = tax_period[c].to_numpy()
+                if c in formats:
+                    label, fmt = formats[c]
+                    table[label] = [fmt.format(v) for v in values]
+                else:
+                    table[c] = values
+            display_df = pd.DataFrame(table)
 
             st.dataframe(display_df, hide_index=True, width="stretch", height=400)
         else:
             st.info(f"Tax period starts FY{tax_start_fy}")
 
 
-def display_tax_single(carbon_tax, tax_start_fy, show_summary=True, period_label=''):
+def _build_tax_figure(tax_data):
+    """Build the tax liability waterfall and its caption text.
+
+    Args:
+        tax_data: Non-empty carbon tax rows filtered to the tax period
+
+    Returns:
+        (fig, caption_text) - the caller wraps caption_text in a styled <p>
+    """
+    # Axis labels straight from the integer year (no prefix regex)
+    year_display = tax_data['FY_num'].astype(str)
+
+    has_s2 = ('Tax_S2_Annual' in tax_data.columns
+              and tax_data['Tax_S2_Annual'].sum() > 0)
+
+    # --- Waterfall calculations ---
+    s1_vals = tax_data.get('Tax_S1_Annual', tax_data['Tax_Annual']).values
+    s2_vals = tax_data['Tax_S2_Annual'].values if has_s2 else np.zeros(len(s1_vals))
+    annual_vals = tax_data['Tax_Annual'].values
+    cum_vals = tax_data['Tax_Cumulative'].values
+    s1_heights = np.abs(s1_vals)
+    s2_heights = np.abs(s2_vals)
+
+    # Waterfall base: each bar floats at previous cumulative
+    bases = np.where(annual_vals >= 0, cum_vals - annual_vals, cum_vals)
+
+    # S2 base sits on top of S1 within the same waterfall position
+    s2_bases = bases + s1_heights
+
+    # Traces and layout are collected first and handed to one
+    # go.Figure() call rather than mutating the figure step by step
+    traces = []
+
+    # --- S1 bars (bottom layer) ---
+    traces.append(
+        go.Bar(
+            x=year_display,
+            y=s1_heights,
+            base=bases,
+            name='Scope 1 Tax',
+            marker_color=S1_COLOR,
+            marker_cornerradius=4,
+            opacity=0.9,
+            width=0.6,
+            customdata=s1_heights,
+            hovertemplate='S1: $%{customdata:,.0f}<extra></extra>'
+        )
+    )
+
+    # --- S2 bars (top layer, same x position) ---
+    if has_s2:
+        traces.append(
+            go.Bar(
+                x=year_display,
+                y=s2_heights,
+                base=s2_bases,
+                name='Scope 2 Tax (Electricity)',
+                marker_color=S2_COLOR,
+                marker_cornerradius=4,
+                opacity=0.9,
+                width=0.6,
+                customdata=s2_heights,
+                hovertemplate='S2: $%{customdata:,.0f}<extra></extra>'
+            )
+        )
+
+    # --- Bar labels (total annual) ---
+    abs_annual = np.abs(annual_vals)
+    bar_labels = np.select(
+        [abs_annual >= 1_000_000, abs_annual >= 1_000, annual_vals != 0],
+        [np.char.mod('$%.1fM', abs_annual / 1_000_000),
+         np.char.mod('$%.0fK', abs_annual / 1_000),
+         np.char.mod('$%.0f', abs_annual)],
+        default='',
+    ).tolist()
+
+    # Long horizons: bars get too thin for every label to fit, so
+    # only the larger amounts (60th percentile and up) keep one
+    label_mask = annual_vals != 0
+    n_labelled = int(label_mask.sum())
+    thinned = len(annual_vals) > _MAX_LABELLED_BARS and n_labelled > 0
+    if thinned:
+        label_mask &= abs_annual >= np.percentile(abs_annual[label_mask], 60)
+
+    # Text labels at bar tops — use annotations not a scatter trace
+    # so they scale correctly with the primary axis
+    year_vals = year_display.to_numpy()
+    annotations = [
+        dict(x=year_vals[i], y=bases[i], text=bar_labels[i], showarrow=False,
+             yshift=-14, font=dict(size=10, color='rgba(57, 37, 11, 0.7)'))
+        for i in np.flatnonzero(label_mask)
+    ]
+
+    # --- Connector lines between bars ---
+    # One line trace with None/NaN breaks between segments rather
+    # than a layout shape per year
+    if len(tax_data) > 1:
+        n_seg = len(year_vals) - 1
+        seg_x = np.empty(3 * n_seg, dtype=object)
+        seg_x[0::3] = year_vals[:-1]
+        seg_x[1::3] = year_vals[1:]
+        seg_x[2::3] = None
+        seg_y = np.empty(3 * n_seg)
+        seg_y[0::3] = cum_vals[:-1]
+        seg_y[1::3] = cum_vals[:-1]
+        seg_y[2::3] = np.nan
+        traces.append(
+            go.Scatter(
+                x=seg_x,
+                y=seg_y,
+                mode='lines',
+                line=dict(color=CONNECTOR, width=1, dash='dot'),
+                showlegend=False,
+                hoverinfo='skip',
+            )
+        )
+
+    # --- Cumulative line on secondary axis ---
+    # Offset line above bars for visual separation
+    # ndarray reduction (cumulative can dip on refunds, so not just [-1])
+    max_cum = max(cum_vals.max(), 1)
+    line_offset = max_cum * 0.08
+    cum_vals_display = cum_vals + line_offset
+
+    # WebGL line only on very long horizons; shorter ones stay SVG so
+    # the line layers with the bars and labels as before
+    line_cls = go.Scattergl if len(tax_data) > WEBGL_MIN_POINTS else go.Scatter
+    traces.append(
+        line_cls(
+            x=year_display,
+            y=cum_vals_display,
+            name='Cumulative Tax ($)',
+            mode='lines+markers',
+            line=dict(color=GOLD_METALLIC, width=3),
+            marker=dict(size=6, color=GOLD_METALLIC),
+            hovertemplate='$%{y:,.0f}<extra></extra>'
+        )
+    )
+
+    # --- Labels at 5-year intervals on cumulative line ---
+    # One text trace instead of an annotation per label
+    key_mask = tax_data['FY_num'].to_numpy() % 5 == 0
+    key_mask[-1] = True
+    key_mask &= cum_vals > 0
+    if key_mask.any():
+        traces.append(
+            go.Scatter(
+                x=year_vals[key_mask],
+                y=cum_vals_display[key_mask],
+                mode='text',
+                text=np.char.mod('<b>$%.1fM</b>', cum_vals[key_mask] / 1e6),
+                textposition='top center',
+                textfont=dict(size=11, color=GOLD_METALLIC),
+                showlegend=False,
+                hoverinfo='skip',
+            )
+        )
+
+    # Axis scaling — match original waterfall proportions.
+    # barmode='overlay' is critical — both traces use explicit base=
+    # so overlay lets them share the same x position
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title="Carbon Tax Liability \u2014 Scope 1 + Scope 2",
+            xaxis=dict(title_text="Year"),
+            yaxis=dict(title_text="Tax Liability (AUD)", range=[0, max_cum * 1.5]),
+            # Zero line
+            shapes=[dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+                         line=dict(color='grey', dash='solid', width=0.5))],
+            annotations=annotations,
+            hovermode='x unified',
+            height=500,
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="top", y=-0.15, xanchor="right", x=1),
+            barmode='overlay',
+            bargap=0.15,
+        )
+    )
+
+    # --- Caption text ---
+    final_year = tax_data['FY'].iloc[-1]
+    final_cumulative = cum_vals[-1]
+    final_rate = tax_data['Tax_Rate'].iloc[-1]
+    final_s1 = tax_data.get('Tax_S1_Cumulative',
+                            pd.Series([0])).iloc[-1]
+    final_s2 = tax_data.get('Tax_S2_Cumulative',
+                            pd.Series([0])).iloc[-1]
+
+    caption_text = (
+        f"{final_year} Cumulative: ${final_cumulative:,.0f} AUD "
+        f"at ${final_rate:.2f}/tCO\u2082-e"
+    )
+    if final_s2 > 0 and final_cumulative > 0:
+        s1_pct = final_s1 / final_cumulative * 100
+        s2_pct = final_s2 / final_cumulative * 100
+        caption_text += (
+            f" &nbsp;(S1: ${final_s1:,.0f} [{s1_pct:.0f}%] "
+            f"| S2: ${final_s2:,.0f} [{s2_pct:.0f}%])"
+        )
+    if thinned:
+        caption_text += (
+            f" &nbsp;Bar labels shown for the {len(annotations)} largest "
+            f"of {n_labelled} taxed years."
+        )
+
+    return fig, caption_text
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_tax_figure(tax_data):
+    """Cached _build_tax_figure().
+
+    Keyed on the tax-period rows, so reruns from unrelated widgets (or a
+    new display year) reuse the built figure.  The figure is shared
+    between reruns and must not be mutated.
+    """
+    return _build_tax_figure(tax_data)
+
+
+def display_tax_single(tax_data, tax_start_fy, show_summary=True, period_label=''):
     """Display tax analysis — waterfall chart with stacked S1/S2.
 
     Uses barmode='overlay' with explicit base= on each trace so S1 and S2
     occupy the same x position.  S1 sits on the waterfall base, S2 sits
     on top of S1.  Connector lines link cumulative positions.
-    """
 
-    year_label = period_label
-
-    # Pastel palette
-    GOLD_METALLIC = '#DBB12A'
-    CAFE_NOIR = '#39250B'
-    S1_COLOR = '#CA564B'       # Warm red-brown (tax = cost)
-    S2_COLOR = '#D4A084'       # Dusty peach (electricity pass-through)
-    CONNECTOR = 'rgba(138, 126, 107, 0.4)'
-
-    tax_data = carbon_tax[carbon_tax['FY_num'] >= tax_start_fy]
+    Args:
+        tax_data: Carbon tax rows already filtered to FY_num >= tax_start_fy
+    """
 
     # --- Summary ---
     if show_summary:
         with st.expander("Summary", expanded=True):
-            year_data = tax_data[tax_data['FY'] == year_label]
-            if len(year_data) == 0:
-                st.warning(f"No tax data for {year_label} (tax starts FY{tax_start_fy})")
+            # Index lookup on the (unique) year labels rather than a boolean
+            # mask + iloc[0]
+            try:
+                row = tax_data.iloc[pd.Index(tax_data['FY']).get_loc(period_label)]
+            except KeyError:
+                row = None
+
+            if row is None:
+                st.warning(f"No tax data for {period_label} (tax starts FY{tax_start_fy})")
             else:
-                row = year_data.iloc[0]
                 summary = {
                     'Scope 1 (tCO\u2082-e)': f"{row['Scope1']:,.0f}",
                     'Tax Rate ($/tCO\u2082-e)': f"${row['Tax_Rate']:.2f}",
@@ -144,194 +394,13 @@ def display_tax_single(carbon_tax, tax_start_fy, show_summary=True, period_label
         if len(tax_data) == 0:
             st.info(f"Tax period starts FY{tax_start_fy}")
         else:
-            tax_data = tax_data.copy()
-            tax_data['Year_Display'] = tax_data['FY'].str.replace(r'^[A-Z]{2}', '', regex=True)
-
-            has_s2 = ('Tax_S2_Annual' in tax_data.columns
-                      and tax_data['Tax_S2_Annual'].sum() > 0)
-
-            fig = go.Figure()
-
-            # --- Waterfall calculations ---
-            s1_vals = tax_data.get('Tax_S1_Annual', tax_data['Tax_Annual']).values
-            s2_vals = tax_data['Tax_S2_Annual'].values if has_s2 else [0] * len(s1_vals)
-            annual_vals = tax_data['Tax_Annual'].values
-            cum_vals = tax_data['Tax_Cumulative'].values
-
-            # Waterfall base: each bar floats at previous cumulative
-            bases = []
-            for i, (ann, cum) in enumerate(zip(annual_vals, cum_vals)):
-                if ann >= 0:
-                    bases.append(cum - ann)
-                else:
-                    bases.append(cum)
-
-            # S2 base sits on top of S1 within the same waterfall position
-            s2_bases = [b + abs(s1) for b, s1 in zip(bases, s1_vals)]
-
-            # --- S1 bars (bottom layer) ---
-            fig.add_trace(
-                go.Bar(
-                    x=tax_data['Year_Display'],
-                    y=[abs(v) for v in s1_vals],
-                    base=bases,
-                    name='Scope 1 Tax',
-                    marker_color=S1_COLOR,
-                    marker_cornerradius=4,
-                    opacity=0.9,
-                    width=0.6,
-                    customdata=[abs(v) for v in s1_vals],
-                    hovertemplate='S1: $%{customdata:,.0f}<extra></extra>'
-                )
-            )
-
-            # --- S2 bars (top layer, same x position) ---
-            if has_s2:
-                fig.add_trace(
-                    go.Bar(
-                        x=tax_data['Year_Display'],
-                        y=[abs(v) for v in s2_vals],
-                        base=s2_bases,
-                        name='Scope 2 Tax (Electricity)',
-                        marker_color=S2_COLOR,
-                        marker_cornerradius=4,
-                        opacity=0.9,
-                        width=0.6,
-                        customdata=[abs(v) for v in s2_vals],
-                        hovertemplate='S2: $%{customdata:,.0f}<extra></extra>'
-                    )
-                )
-
-            # --- Bar labels (total annual) ---
-            bar_labels = []
-            for v in annual_vals:
-                if abs(v) >= 1_000_000:
-                    bar_labels.append(f"${abs(v)/1_000_000:.1f}M")
-                elif abs(v) >= 1_000:
-                    bar_labels.append(f"${abs(v)/1_000:.0f}K")
-                elif v != 0:
-                    bar_labels.append(f"${abs(v):,.0f}")
-                else:
-                    bar_labels.append("")
-
-            # Text labels at bar tops — use annotations not a scatter trace
-            # so they scale correctly with the primary axis
-            for i, label in enumerate(bar_labels):
-                if label:
-                    fig.add_annotation(
-                        x=tax_data['Year_Display'].iloc[i],
-                        y=bases[i],
-                        text=label,
-                        showarrow=False,
-                        yshift=-14,
-                        font=dict(size=10, color='rgba(57, 37, 11, 0.7)'),
-                    )
-
-            # --- Connector lines between bars ---
-            for i in range(1, len(tax_data)):
-                prev_cum = cum_vals[i - 1]
-                fig.add_shape(
-                    type="line",
-                    x0=tax_data['Year_Display'].iloc[i - 1],
-                    x1=tax_data['Year_Display'].iloc[i],
-                    y0=prev_cum,
-                    y1=prev_cum,
-                    line=dict(color=CONNECTOR, width=1, dash='dot'),
-                )
-
-            # --- Cumulative line on secondary axis ---
-            # Offset line above bars for visual separation
-            max_cum = max(tax_data['Tax_Cumulative'].max(), 1)
-            line_offset = max_cum * 0.08
-            cum_vals_display = cum_vals + line_offset
-
-            fig.add_trace(
-                go.Scatter(
-                    x=tax_data['Year_Display'],
-                    y=cum_vals_display,
-                    name='Cumulative Tax ($)',
-                    mode='lines+markers',
-                    line=dict(color=GOLD_METALLIC, width=3),
-                    marker=dict(size=6, color=GOLD_METALLIC),
-                    hovertemplate='$%{y:,.0f}<extra></extra>'
-                )
-            )
-
-            # --- Labels at 5-year intervals on cumulative line ---
-            years_list = tax_data['Year_Display'].tolist()
-            key_indices = set()
-            for idx, yr in enumerate(years_list):
-                try:
-                    if int(yr) % 5 == 0:
-                        key_indices.add(idx)
-                except ValueError:
-                    pass
-            key_indices.add(len(years_list) - 1)
-
-            for idx in key_indices:
-                if idx < len(years_list) and cum_vals[idx] > 0:
-                    val_m = cum_vals[idx] / 1e6
-                    fig.add_annotation(
-                        x=years_list[idx],
-                        y=cum_vals_display[idx],
-
-                        text=f"<b>${val_m:.1f}M</b>",
-                        showarrow=False,
-                        yshift=14,
-                        font=dict(size=11, color=GOLD_METALLIC),
-                    )
-
-            # Zero line
-            fig.add_hline(y=0, line_dash="solid", line_color="grey",
-                         line_width=0.5)
-
-            # Axis scaling — match original waterfall proportions
-            fig.update_xaxes(
-                title_text="Year"
-            )
-            fig.update_yaxes(
-                title_text="Tax Liability (AUD)",
-                range=[0, max_cum * 1.5]
-            )
-
-            # barmode='overlay' is critical — both traces use explicit base=
-            # so overlay lets them share the same x position
-            fig.update_layout(
-                title="Carbon Tax Liability \u2014 Scope 1 + Scope 2",
-                hovermode='x unified',
-                height=500,
-                showlegend=True,
-                legend=dict(orientation="h", yanchor="top", y=-0.15, xanchor="right", x=1),
-                barmode='overlay',
-                bargap=0.15,
-            )
-
+            fig, caption_text = _cached_tax_figure(tax_data)
             st.plotly_chart(fig, width='stretch', key="tax_liability")
 
             # Caption — use st.markdown with inline style to avoid
             # st.caption's markdown rendering mangling $ signs as LaTeX
-            if len(tax_data) > 0:
-                final_year = tax_data['FY'].iloc[-1]
-                final_cumulative = tax_data['Tax_Cumulative'].iloc[-1]
-                final_rate = tax_data['Tax_Rate'].iloc[-1]
-                final_s1 = tax_data.get('Tax_S1_Cumulative',
-                                        pd.Series([0])).iloc[-1]
-                final_s2 = tax_data.get('Tax_S2_Cumulative',
-                                        pd.Series([0])).iloc[-1]
-
-                caption_text = (
-                    f"{final_year} Cumulative: ${final_cumulative:,.0f} AUD "
-                    f"at ${final_rate:.2f}/tCO\u2082-e"
-                )
-                if final_s2 > 0 and final_cumulative > 0:
-                    s1_pct = final_s1 / final_cumulative * 100
-                    s2_pct = final_s2 / final_cumulative * 100
-                    caption_text += (
-                        f" &nbsp;(S1: ${final_s1:,.0f} [{s1_pct:.0f}%] "
-                        f"| S2: ${final_s2:,.0f} [{s2_pct:.0f}%])"
-                    )
-                st.markdown(
-                    f'<p style="font-size:13px; color:#6B7280; margin-top:4px;">'
-                    f'{caption_text}</p>',
-                    unsafe_allow_html=True
-                )
\ No newline at end of file
+            st.markdown(
+                f'<p style="font-size:13px; color:#6B7280; margin-top:4px;">'
+                f'{caption_text}</p>',
+                unsafe_allow_html=True
+            )
@@ -13,8 +13,10 @@ Displays:
 """
 # NOTE FOR CLAUDE: This file contains emojis and special chars. Use binary-safe editing (rb/wb).
 
+import os
 import streamlit as st
 import pandas as pd
+import numpy as np
 from Config import (
     FSEI_ROM, FSEI_ELEC, SITE_GENERATION_RATIO,
     DEFAULT_INDUSTRY_EI_ROM, DEFAULT_INDUSTRY_EI_ELEC,
@@ -23,10 +25,375 @@ from Config import (
     DECLINE_RATE_PHASE1, DECLINE_RATE_PHASE2,
     DECLINE_PHASE1_START, DECLINE_PHASE1_END,
     DECLINE_PHASE2_START, DECLINE_PHASE2_END,
-    TRANSITION_SCHEDULE, get_transition_proportion,
+    TRANSITION_SCHEDULE, get_transition_proportions,
     S58B_EARLIEST_FY, S58B_LOOKBACK, S58B_MIN_COVERED,
 )
-from Projections import calculate_erc_for_fy, calculate_hybrid_ei
+from Projections import calculate_erc_for_fy_array, calculate_hybrid_ei_array
+
+
+# Static reference tables, built once at import rather than on every rerun.
+# Shared across sessions, so they must not be mutated.
+
+# Default EI (Safeguard Rule, Schedule 1)
+_EI_DEFAULT_DF = pd.DataFrame([
+    {"Production Variable": "ROM metal ore",
+     "Value": f"{DEFAULT_INDUSTRY_EI_ROM:.5f}",
+     "Unit": "tCO\u2082-e/t"},
+    {"Production Variable": "Electricity generation",
+     "Value": f"{DEFAULT_INDUSTRY_EI_ELEC:.3f}",
+     "Unit": "tCO\u2082-e/MWh"},
+])
+
+# Best Practice EI (Safeguard Rule, Schedule 1)
+_EI_BP_DF = pd.DataFrame([
+    {"Production Variable": "ROM metal ore",
+     "Value": f"{BEST_PRACTICE_EI_ROM:.5f}",
+     "Unit": "tCO\u2082-e/t"},
+    {"Production Variable": "Electricity generation",
+     "Value": f"{BEST_PRACTICE_EI_ELEC:.3f}",
+     "Unit": "tCO\u2082-e/MWh"},
+])
+
+# Model parameter -> authorising provision
+_COMPLIANCE_DF = pd.DataFrame([
+    {"Model Parameter": "Baseline formula",
+     "Value": "ERC \u00d7 \u03a3[h\u00b7EI + (1\u2212h)\u00b7EIF] \u00d7 Q",
+     "Provision": "s11(1)",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "Rounding",
+     "Value": "Nearest whole number",
+     "Provision": "s11(2)",
+     "Status": "\u2705 \u00b11 tCO\u2082-e"},
+    {"Model Parameter": "Transition proportion (h)",
+     "Value": "0.1 \u2192 1.0 per schedule",
+     "Provision": "s13 Table",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "Default ERC",
+     "Value": "0.951 declining to 0.657",
+     "Provision": "s31 Table",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "Phase 1 decline rate",
+     "Value": "4.9% linear",
+     "Provision": "s32 Items 1\u20137",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "Phase 2 decline rate",
+     "Value": "3.285% linear",
+     "Provision": "s32 Item 8",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "Regular facility ERC",
+     "Value": "= Default ERC",
+     "Provision": "s33(1)",
+     "Status": "\u2705 Confirmed"},
+    {"Model Parameter": "FSEI ROM",
+     "Value": "0.0177 tCO\u2082-e/t",
+     "Provision": "EID (s14\u2013s16)",
+     "Status": "\u2705 CER Oct 2024"},
+    {"Model Parameter": "FSEI Electricity",
+     "Value": "0.9081 tCO\u2082-e/MWh",
+     "Provision": "EID (s14\u2013s16)",
+     "Status": "\u2705 CER Oct 2024"},
+    {"Model Parameter": "Default EI ROM",
+     "Value": "0.00859 tCO\u2082-e/t",
+     "Provision": "Schedule 1",
+     "Status": "\u2705 CER confirmed"},
+    {"Model Parameter": "Default EI Electricity",
+     "Value": "0.539 tCO\u2082-e/MWh",
+     "Provision": "Schedule 1",
+     "Status": "\u2705 CER confirmed"},
+    {"Model Parameter": "Safeguard threshold",
+     "Value": "100,000 tCO\u2082-e",
+     "Provision": "NGER Act s22X",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "Minimum baseline floor",
+     "Value": "100,000 tCO\u2082-e",
+     "Provision": "CER practice",
+     "Status": "\u2705 Applied"},
+    {"Model Parameter": "s58B earliest FY",
+     "Value": "FY2029",
+     "Provision": "s58B(2)(a)",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "s58B lookback",
+     "Value": "3 of prev 5 FYs",
+     "Provision": "s58B(2)(b)",
+     "Status": "\u2705 Exact"},
+    {"Model Parameter": "SMC issuance",
+     "Value": "Baseline \u2212 Scope 1",
+     "Provision": "s22XB (NGER Act)",
+     "Status": "\u2705 Verified"},
+    {"Model Parameter": "SMC surrender restriction",
+     "Value": "Covered facilities only",
+     "Provision": "s22XN (NGER Act)",
+     "Status": "\u2705 Applied"},
+])
+_COMPLIANCE_DF['Provision'] = _COMPLIANCE_DF['Provision'].astype('category')
+_COMPLIANCE_DF['Status'] = _COMPLIANCE_DF['Status'].astype('category')
+
+
+@st.cache_data(show_spinner=False)
+def _build_eif_df(fsei_rom, fsei_elec):
+    """Facility-specific EI table (the only EI table that depends on inputs)."""
+    return pd.DataFrame([
+        {"Production Variable": "ROM metal ore",
+         "Value": f"{fsei_rom:.4f}",
+         "Unit": "tCO\u2082-e/t"},
+        {"Production Variable": "Electricity generation",
+         "Value": f"{fsei_elec:.4f}",
+         "Unit": "tCO\u2082-e/MWh"},
+    ])
+
+
+@st.cache_data(show_spinner=False)
+def _build_schedule_df(fsei_rom, fsei_elec, decline_rate_phase2):
+    """ERC decline and hybrid EI transition table, FY2024-FY2035.
+
+    Depends only on the three scalars, so reruns reuse the cached table.
+    """
+    # Whole schedule as arrays (one call per function, not per FY)
+    fys = np.arange(2024, 2036)
+    erc = calculate_erc_for_fy_array(fys, decline_rate_phase2)
+    h = get_transition_proportions(fys)
+    h_rom, h_elec = calculate_hybrid_ei_array(fys, fsei_rom, fsei_elec)
+    phase2_label = f"Phase 2 ({decline_rate_phase2 * 100:.1f}%)"
+
+    # Display strings formatted column-wise
+    return pd.DataFrame({
+        "FY": np.char.add(np.char.mod('%d-', fys - 1), np.char.mod('%d', fys)),
+        "n": fys - 2023,
+        "ERC": np.char.mod('%.3f', erc),
+        "h (Default %)": np.char.mod('%.0f%%', h * 100),
+        "1-h (FSEI %)": np.char.mod('%.0f%%', (1 - h) * 100),
+        "Hybrid EI ROM": np.char.mod('%.5f', h_rom),
+        "Hybrid EI Elec": np.char.mod('%.4f', h_elec),
+        "Phase": pd.Categorical(
+            np.where(fys <= DECLINE_PHASE1_END, "Phase 1 (4.9%)", phase2_label)
+        ),
+    })
+
+
+# Fuels used at Ravenswood (matching NGAFuel column in emissions data)
+_NGA_USED_FUELS = [
+    'Diesel oil',
+    'Grid electricity',
+    'Liquefied petroleum gas (LPG)',
+    'Petroleum based greases',
+    'Petroleum based oils (other than petroleum based oil used as fuel), e.g. lubricants',
+    'Gaseous fossil fuels other than those mentioned in the items above',
+]
+
+# Short display names
+_NGA_FUEL_SHORT = {
+    'Diesel oil': 'Diesel',
+    'Grid electricity': 'Grid Electricity (QLD)',
+    'Liquefied petroleum gas (LPG)': 'LPG',
+    'Petroleum based greases': 'Petroleum Greases',
+    'Petroleum based oils (other than petroleum based oil used as fuel), e.g. lubricants': 'Lubricating Oils',
+    'Gaseous fossil fuels other than those mentioned in the items above': 'Gaseous Fossil Fuels (Acetylene)',
+}
+
+# NgaFactors.csv in Data/ beside this module, independent of the working directory
+_NGA_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Data', 'NgaFactors.csv')
+
+# NgaFactors.csv columns the factor table reads
+_NGA_COLUMNS = ['NGA_Year', 'Fuel_Name', 'Scope', 'EF_kgCO2e_per_unit', 'EF_Unit', 'State']
+
+
+@st.cache_data(show_spinner=False)
+def _load_nga_factor_table():
+    """Read NgaFactors.csv and build the fuels x NGA-year display table.
+
+    Cached, so the CSV is read and reshaped once per process rather than
+    on every rerun.
+
+    Returns:
+        DataFrame of formatted factors (empty if no used fuel matched),
+        or None if NgaFactors.csv is missing or empty
+    """
+    if not os.path.exists(_NGA_CSV):
+        return None
+    nga_df = pd.read_csv(_NGA_CSV, usecols=_NGA_COLUMNS)
+
+    if len(nga_df) == 0:
+        return None
+
+    years = sorted(nga_df['NGA_Year'].unique())
+
+    # Used fuels only; grid electricity is state-specific, so QLD rows only
+    used = nga_df[nga_df['Fuel_Name'].isin(_NGA_USED_FUELS)]
+    used = used[(used['Fuel_Name'] != 'Grid electricity') | (used['State'] == 'QLD')]
+
+    # One row per fuel/scope (first unit listed), in used-fuel then scope order
+    keys = ['Fuel_Name', 'Scope']
+    rows = used.drop_duplicates(keys)[keys + ['EF_Unit']]
+    rows = rows.assign(_order=rows['Fuel_Name'].map(_NGA_USED_FUELS.index))
+    rows = rows.sort_values(['_order', 'Scope'])
+
+    # Fuel/scope x NGA year in one reshape (first factor per cell)
+    wide = (
+        used.drop_duplicates(keys + ['NGA_Year'])
+        .set_index(keys + ['NGA_Year'])['EF_kgCO2e_per_unit']
+        .unstack('NGA_Year')
+        .reindex(index=pd.MultiIndex.from_frame(rows[keys]), columns=years)
+    )
+
+    # Pre-formatted strings, so the display path needs no Styler
+    # (column-wise Series.map; DataFrame.map needs pandas 2.1)
+    factors = wide.apply(lambda col: col.map(_format_factor))
+    factors = factors.set_axis(list(map(str, years)), axis=1)
+    labels = pd.DataFrame({
+        'Fuel': rows['Fuel_Name'].map(_NGA_FUEL_SHORT).to_numpy(),
+        'Scope': rows['Scope'].astype(int).to_numpy(),
+        'Unit': rows['EF_Unit'].to_numpy(),
+    })
+    return pd.concat([labels, factors.reset_index(drop=True)], axis=1)
+
+
+def _format_factor(val):
+    """Display format for an NGA factor; a dash where none is published."""
+    if pd.isna(val):
+        return '\u2014'
+    if abs(val) < 1:
+        return f"{val:.5f}"
+    if abs(val) < 10:
+        return f"{val:.2f}"
+    return f"{val:,.2f}"
+
+
+# Static markdown blocks, built once at import
+_FORMULA_TERMS_MD = """
+**Formula terms (per s11(1)):**
+
+| Symbol | Legislation | Description |
+|--------|-------------|-------------|
+| ERC | s31/s33 | Emissions Reduction Contribution |
+| h | s13 | Transition proportion |
+| EI | Schedule 1 | Default (industry-average) emissions intensity |
+| EIF | s14\u2013s16 | Facility-specific EI (from approved EID) |
+| Q | s11(1) | Production quantity (applies when EID specifies EIF) |
+| Q\u2082 | s11(1) | = 0 when EID specifies EIF for that variable |
+| BA | s11(1) | Borrowing Adjustment |
+"""
+
+_RAVENSWOOD_TERMS_MD = """
+**Ravenswood application (2 production variables):**
+
+| Component | Value | Source |
+|-----------|-------|--------|
+| PV 1: ROM metal ore | Q = tonnes mined | EID (CER Oct 2024) |
+| PV 2: Electricity generation | Q = MWh on-site | EID (CER Oct 2024) |
+| EI\u2082 \u00d7 Q\u2082 | = 0 | EID covers both PVs |
+| BA (Borrowing) | 0 | Not used |
+| Minimum baseline | 100,000 tCO\u2082-e/year | CER practice |
+"""
+
+_TRANSITION_NOTES_MD = """
+**Hybrid EI Transition (s13):**
+- FY2024\u2013FY2027: +10% Default per year (Items 1\u20134)
+- FY2028\u2013FY2030: +20% Default per year (Items 5\u20136, step-up)
+- FY2030 onwards: h = 1.0 (100% Default EI, 0% FSEI) per Item 7
+- Transition converges all facilities to industry average
+"""
+
+_CROSS_CHECKS_MD = """
+**Cross-checks performed:**
+- FY2024 baseline: **269,728** (exact match with CER/NGERS)
+- FY2025 baseline: **214,665** (independently verified)
+- FY2024 SMC: **132,501** (exact match with CER-issued credits, Jan 2025)
+- FY2025 SMC: **70,687** (exact match with CER guidance)
+"""
+
+_CER_INTERPRETATIONS_MD = """
+**Key legislative interpretations confirmed by CER:**
+- Existing facilities use Default EI (not Best Practice) in transition (Oct 2024)
+- s58B opt-in confirmed as available where 3-of-5 lookback met (CER guidance)
+- No time limits on SMC trading or sale (CER guidance)
+- Surrender restricted to covered facilities per s22XN (CER guidance)
+"""
+
+_EXPLOSIVES_MD = """
+#### Dual-Framework Treatment of Explosives
+
+Explosives (ANFO) are treated differently under the two reporting frameworks
+used in this model.  The table below summarises the position.
+
+| Aspect | GHG Protocol (Tab 1) | NGER (Safeguard / Tab 2) |
+|--------|---------------------|--------------------------|
+| **Scope 1 emissions** | Yes — 0.17 t CO₂/t ANFO | No — not reportable |
+| **Basis** | AGO / Dept of Climate Change emission factor; GHG Protocol Corporate Standard | CER guideline s2.7 (July 2025); NGER Measurement Determination s2.68 |
+| **Rationale** | Detonation of fossil fuel component is a direct emission at the facility | Fuel oil in ANFO is reported as consumed without combustion by the entity at the point of final mixing |
+| **Reporting entity** | Facility operator (regardless of who detonates) | Entity with operational control at point of final mixing (Orica) |
+| **Scope 3** | Not applicable (Scope 1 captures the detonation) | Not applicable |
+
+**Implementation in this model:**
+
+- **Tab 1 (GHG):** Explosives consumption (kg) is multiplied by 0.17 t CO₂/t
+  (converted to kg basis) and included in Scope 1.  These rows are flagged
+  `GHG_Only = True` so they can be excluded from NGER calculations.
+
+- **Tab 2 (Safeguard):** GHG-only rows are excluded from baseline calculations,
+  emission intensity and SMC computation.  The Safeguard Mechanism operates
+  under NGER, where explosives carry zero emissions.
+
+- **Emission factor source:** AGO / Department of Climate Change, as applied
+  in Australian mining GHG assessments (e.g. Balmoral South Iron Ore Project,
+  Kewan Bond Pty Ltd, 2008).  Factor is pending confirmation against the
+  current NGA Factors publication.
+
+**Contracted blasting (Orica):**  Orica detonates on site under contract.
+Under strict GHG Protocol operational control, this could be argued as
+Scope 3 (Category 1: Purchased Goods and Services).  However, Australian
+mining industry practice commonly reports ANFO detonation as Scope 1 in
+GHG/GRI disclosures using AGO methods, regardless of who performs the blast.
+This model follows that convention for Tab 1.
+"""
+
+_REFERENCES_MD = """
+**Primary legislation:**
+- National Greenhouse and Energy Reporting Act 2007 (NGER Act)
+  - s22XB (safeguard mechanism credit units \u2014 issuance)
+  - s22XE (safeguard mechanism credit units \u2014 surrender)
+  - s22XN (restriction on surrender by non-covered facilities)
+  - s22XS (rule-making power for Safeguard Mechanism)
+- National Greenhouse and Energy Reporting (Safeguard Mechanism) Rule 2015
+  - Compilation F2024C00846, registered 02/10/2024
+  - Part 3, Division 2, Subdivision A, s11 (baseline formula)
+  - Part 3, Division 2, Subdivision B, s13 (transition proportion)
+  - Part 3, Division 2, Subdivision C, s14\u2013s16 (emissions intensity determination)
+  - Part 3, Division 5, Subdivision A, s31 (default ERC)
+  - Part 3, Division 5, s32 (default decline rate)
+  - Part 3, Division 5, Subdivision B, s33 (regular facility ERC)
+  - Part 3A, s58B (eligible facility \u2014 opt-in for below-threshold)
+  - Schedule 1 (default and best practice emissions intensities)
+- NGER Regulations 2008 (F2025C01114)
+- NGER (Measurement) Determination 2008
+
+**Regulatory guidance:**
+- DCCEEW: Safeguard Mechanism reforms factsheet (4.9% decline, ERC definition)
+- Clean Energy Regulator: Facility overview for Ravenswood Mine (FY2023\u201324)
+- CER: s58B eligibility guidance (referenced in CER guidance)
+- CER: Confirmation that existing facilities use Default EI (October 2024)
+
+**Facility-specific data:**
+- EID Basis of Preparation (February 2024)
+- NGER Section 19 submission (October 2024)
+  - Production: 11,624,570 t ROM, 101,540.078 MWh
+  - Covered emissions: 137,227 tCO\u2082-e
+  - Calculated baseline: 269,728 tCO\u2082-e (FY2023\u201324, ERC = 0.951)
+  - SMCs issued: 132,501 (CER, January 2025)
+  - Slide 4: FY2024 status and SMC confirmation
+  - Slide 5: FY2025\u2013FY2030 production forecast
+  - Slide 6: FY2025 baseline calculation (214,665 tCO\u2082-e)
+  - Slide 8: Emissions forecast and baseline comparison
+  - Slide 9: SMC cumulative forecast and CER s58B guidance
+
+**Emission factors:**
+- National Greenhouse Accounts Factors 2021\u20132025
+  (Commonwealth of Australia, DCCEEW)
+
+**Model parameters:**
+- Grid connection: 1 July 2027 (baked into consolidated CSV)
+- Diesel classification: on-site mining equipment = stationary energy (NGER Measurement Determination 2008)
+- Transport fuel: road-registered light vehicles only
+"""
 
 
 def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
@@ -59,32 +426,10 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
 
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("""
-**Formula terms (per s11(1)):**
-
-| Symbol | Legislation | Description |
-|--------|-------------|-------------|
-| ERC | s31/s33 | Emissions Reduction Contribution |
-| h | s13 | Transition proportion |
-| EI | Schedule 1 | Default (industry-average) emissions intensity |
-| EIF | s14\u2013s16 | Facility-specific EI (from approved EID) |
-| Q | s11(1) | Production quantity (applies when EID specifies EIF) |
-| Q\u2082 | s11(1) | = 0 when EID specifies EIF for that variable |
-| BA | s11(1) | Borrowing Adjustment |
-""")
+            st.markdown(_FORMULA_TERMS_MD)
 
         with col2:
-            st.markdown("""
-**Ravenswood application (2 production variables):**
-
-| Component | Value | Source |
-|-----------|-------|--------|
-| PV 1: ROM metal ore | Q = tonnes mined | EID (CER Oct 2024) |
-| PV 2: Electricity generation | Q = MWh on-site | EID (CER Oct 2024) |
-| EI\u2082 \u00d7 Q\u2082 | = 0 | EID covers both PVs |
-| BA (Borrowing) | 0 | Not used |
-| Minimum baseline | 100,000 tCO\u2082-e/year | CER practice |
-""")
+            st.markdown(_RAVENSWOOD_TERMS_MD)
 
         st.markdown(
             '> **Section 11(2):** "The number worked out using the formula in '
@@ -135,43 +480,19 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
             st.markdown("##### Facility-Specific EI (EIF)")
             st.markdown("*From approved EID, CER October 2024*")
             st.markdown("*Per s14\u2013s16 of the Safeguard Rule*")
-            ei_fsei = pd.DataFrame([
-                {"Production Variable": "ROM metal ore",
-                 "Value": f"{fsei_rom:.4f}",
-                 "Unit": "tCO\u2082-e/t"},
-                {"Production Variable": "Electricity generation",
-                 "Value": f"{fsei_elec:.4f}",
-                 "Unit": "tCO\u2082-e/MWh"},
-            ])
-            st.dataframe(ei_fsei, hide_index=True, width="stretch")
+            st.dataframe(_build_eif_df(fsei_rom, fsei_elec), hide_index=True, width="stretch")
 
         with col2:
             st.markdown("##### Default EI (Industry Average)")
             st.markdown("*Safeguard Rule, Schedule 1*")
             st.markdown("*Confirmed by CER Oct 2024: existing facilities use Default EI*")
-            ei_default = pd.DataFrame([
-                {"Production Variable": "ROM metal ore",
-                 "Value": f"{DEFAULT_INDUSTRY_EI_ROM:.5f}",
-                 "Unit": "tCO\u2082-e/t"},
-                {"Production Variable": "Electricity generation",
-                 "Value": f"{DEFAULT_INDUSTRY_EI_ELEC:.3f}",
-                 "Unit": "tCO\u2082-e/MWh"},
-            ])
-            st.dataframe(ei_default, hide_index=True, width="stretch")
+            st.dataframe(_EI_DEFAULT_DF, hide_index=True, width="stretch")
 
         with col3:
             st.markdown("##### Best Practice EI")
             st.markdown("*Safeguard Rule, Schedule 1*")
             st.markdown("*Applies to new facilities/products only*")
-            ei_bp = pd.DataFrame([
-                {"Production Variable": "ROM metal ore",
-                 "Value": f"{BEST_PRACTICE_EI_ROM:.5f}",
-                 "Unit": "tCO\u2082-e/t"},
-                {"Production Variable": "Electricity generation",
-                 "Value": f"{BEST_PRACTICE_EI_ELEC:.3f}",
-                 "Unit": "tCO\u2082-e/MWh"},
-            ])
-            st.dataframe(ei_bp, hide_index=True, width="stretch")
+            st.dataframe(_EI_BP_DF, hide_index=True, width="stretch")
 
         st.caption(
             f"Site generation ratio: {SITE_GENERATION_RATIO:.6f} MWh/t ROM "
@@ -210,24 +531,7 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
             "ERC = default ERC from the s31 table."
         )
 
-        schedule_data = []
-        for fy in range(2024, 2036):
-            erc = calculate_erc_for_fy(fy, decline_rate_phase2)
-            h = get_transition_proportion(fy)
-            h_rom, h_elec = calculate_hybrid_ei(fy, fsei_rom, fsei_elec)
-
-            schedule_data.append({
-                "FY": f"{fy-1}-{fy}",
-                "n": fy - 2023,
-                "ERC": f"{erc:.3f}",
-                "h (Default %)": f"{h*100:.0f}%",
-                "1-h (FSEI %)": f"{(1-h)*100:.0f}%",
-                "Hybrid EI ROM": f"{h_rom:.5f}",
-                "Hybrid EI Elec": f"{h_elec:.4f}",
-                "Phase": "Phase 1 (4.9%)" if fy <= DECLINE_PHASE1_END else f"Phase 2 ({decline_rate_phase2 * 100:.1f}%)",
-            })
-
-        schedule_df = pd.DataFrame(schedule_data)
+        schedule_df = _build_schedule_df(fsei_rom, fsei_elec, decline_rate_phase2)
         st.dataframe(schedule_df, hide_index=True, width="stretch")
 
         col1, col2 = st.columns(2)
@@ -241,13 +545,7 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
 """)
 
         with col2:
-            st.markdown("""
-**Hybrid EI Transition (s13):**
-- FY2024\u2013FY2027: +10% Default per year (Items 1\u20134)
-- FY2028\u2013FY2030: +20% Default per year (Items 5\u20136, step-up)
-- FY2030 onwards: h = 1.0 (100% Default EI, 0% FSEI) per Item 7
-- Transition converges all facilities to industry average
-""")
+            st.markdown(_TRANSITION_NOTES_MD)
 
     # =================================================================
     # SECTION 4: BASELINE VALIDATION
@@ -263,99 +561,17 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
             "registered 02/10/2024) and the NGER Regulations 2008 (F2025C01114)."
         )
 
-        compliance_data = pd.DataFrame([
-            {"Model Parameter": "Baseline formula",
-             "Value": "ERC \u00d7 \u03a3[h\u00b7EI + (1\u2212h)\u00b7EIF] \u00d7 Q",
-             "Provision": "s11(1)",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "Rounding",
-             "Value": "Nearest whole number",
-             "Provision": "s11(2)",
-             "Status": "\u2705 \u00b11 tCO\u2082-e"},
-            {"Model Parameter": "Transition proportion (h)",
-             "Value": "0.1 \u2192 1.0 per schedule",
-             "Provision": "s13 Table",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "Default ERC",
-             "Value": "0.951 declining to 0.657",
-             "Provision": "s31 Table",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "Phase 1 decline rate",
-             "Value": "4.9% linear",
-             "Provision": "s32 Items 1\u20137",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "Phase 2 decline rate",
-             "Value": "3.285% linear",
-             "Provision": "s32 Item 8",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "Regular facility ERC",
-             "Value": "= Default ERC",
-             "Provision": "s33(1)",
-             "Status": "\u2705 Confirmed"},
-            {"Model Parameter": "FSEI ROM",
-             "Value": "0.0177 tCO\u2082-e/t",
-             "Provision": "EID (s14\u2013s16)",
-             "Status": "\u2705 CER Oct 2024"},
-            {"Model Parameter": "FSEI Electricity",
-             "Value": "0.9081 tCO\u2082-e/MWh",
-             "Provision": "EID (s14\u2013s16)",
-             "Status": "\u2705 CER Oct 2024"},
-            {"Model Parameter": "Default EI ROM",
-             "Value": "0.00859 tCO\u2082-e/t",
-             "Provision": "Schedule 1",
-             "Status": "\u2705 CER confirmed"},
-            {"Model Parameter": "Default EI Electricity",
-             "Value": "0.539 tCO\u2082-e/MWh",
-             "Provision": "Schedule 1",
-             "Status": "\u2705 CER confirmed"},
-            {"Model Parameter": "Safeguard threshold",
-             "Value": "100,000 tCO\u2082-e",
-             "Provision": "NGER Act s22X",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "Minimum baseline floor",
-             "Value": "100,000 tCO\u2082-e",
-             "Provision": "CER practice",
-             "Status": "\u2705 Applied"},
-            {"Model Parameter": "s58B earliest FY",
-             "Value": "FY2029",
-             "Provision": "s58B(2)(a)",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "s58B lookback",
-             "Value": "3 of prev 5 FYs",
-             "Provision": "s58B(2)(b)",
-             "Status": "\u2705 Exact"},
-            {"Model Parameter": "SMC issuance",
-             "Value": "Baseline \u2212 Scope 1",
-             "Provision": "s22XB (NGER Act)",
-             "Status": "\u2705 Verified"},
-            {"Model Parameter": "SMC surrender restriction",
-             "Value": "Covered facilities only",
-             "Provision": "s22XN (NGER Act)",
-             "Status": "\u2705 Applied"},
-        ])
-        st.dataframe(compliance_data, hide_index=True, width="stretch")
+        st.dataframe(_COMPLIANCE_DF, hide_index=True, width="stretch")
 
         st.markdown("---")
         st.markdown("#### Validation Results")
 
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("""
-**Cross-checks performed:**
-- FY2024 baseline: **269,728** (exact match with CER/NGERS)
-- FY2025 baseline: **214,665** (independently verified)
-- FY2024 SMC: **132,501** (exact match with CER-issued credits, Jan 2025)
-- FY2025 SMC: **70,687** (exact match with CER guidance)
-""")
+            st.markdown(_CROSS_CHECKS_MD)
 
         with col2:
-            st.markdown("""
-**Key legislative interpretations confirmed by CER:**
-- Existing facilities use Default EI (not Best Practice) in transition (Oct 2024)
-- s58B opt-in confirmed as available where 3-of-5 lookback met (CER guidance)
-- No time limits on SMC trading or sale (CER guidance)
-- Surrender restricted to covered facilities per s22XN (CER guidance)
-""")
+            st.markdown(_CER_INTERPRETATIONS_MD)
 
         st.success(
             "All model parameters are traceable to specific provisions of the "
@@ -377,73 +593,10 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
             "Only fuels present in the Ravenswood emissions data are shown."
         )
 
-        # Build comprehensive factor table from NgaFactors.csv
-        try:
-            nga_df = pd.read_csv('NgaFactors.csv')
-        except FileNotFoundError:
-            nga_df = pd.DataFrame()
-
-        if len(nga_df) > 0:
-            # Fuels used at Ravenswood (matching NGAFuel column in emissions data)
-            used_fuels = [
-                'Diesel oil',
-                'Grid electricity',
-                'Liquefied petroleum gas (LPG)',
-                'Petroleum based greases',
-                'Petroleum based oils (other than petroleum based oil used as fuel), e.g. lubricants',
-                'Gaseous fossil fuels other than those mentioned in the items above',
-            ]
-
-            # Short display names
-            fuel_short = {
-                'Diesel oil': 'Diesel',
-                'Grid electricity': 'Grid Electricity (QLD)',
-                'Liquefied petroleum gas (LPG)': 'LPG',
-                'Petroleum based greases': 'Petroleum Greases',
-                'Petroleum based oils (other than petroleum based oil used as fuel), e.g. lubricants': 'Lubricating Oils',
-                'Gaseous fossil fuels other than those mentioned in the items above': 'Gaseous Fossil Fuels (Acetylene)',
-            }
-
-            years = sorted(nga_df['NGA_Year'].unique())
-
-            table_rows = []
-            for fuel in used_fuels:
-                fuel_data = nga_df[nga_df['Fuel_Name'] == fuel]
-                if len(fuel_data) == 0:
-                    continue
-
-                short_name = fuel_short.get(fuel, fuel)
-
-                # Filter to QLD for grid electricity (state-specific)
-                if fuel == 'Grid electricity':
-                    fuel_data = fuel_data[fuel_data['State'] == 'QLD']
-
-                for scope in sorted(fuel_data['Scope'].unique()):
-                    scope_data = fuel_data[fuel_data['Scope'] == scope]
-                    unit = scope_data['EF_Unit'].iloc[0] if len(scope_data) > 0 else ''
-
-                    row = {
-                        'Fuel': short_name,
-                        'Scope': int(scope),
-                        'Unit': unit,
-                    }
-                    for year in years:
-                        yr_data = scope_data[scope_data['NGA_Year'] == year]
-                        if len(yr_data) > 0:
-                            val = yr_data['EF_kgCO2e_per_unit'].iloc[0]
-                            if abs(val) < 1:
-                                row[str(year)] = f"{val:.5f}"
-                            elif abs(val) < 10:
-                                row[str(year)] = f"{val:.2f}"
-                            else:
-                                row[str(year)] = f"{val:,.2f}"
-                        else:
-                            row[str(year)] = '\u2014'
-
-                    table_rows.append(row)
-
-            if table_rows:
-                factor_df = pd.DataFrame(table_rows)
+        factor_df = _load_nga_factor_table()
+
+        if factor_df is not None:
+            if len(factor_df) > 0:
                 st.dataframe(factor_df, hide_index=True, width="stretch")
 
                 st.caption(
@@ -462,42 +615,7 @@ def render_nger_tab(fsei_rom=FSEI_ROM, fsei_elec=FSEI_ELEC,
     # =================================================================
     with st.expander("GHG Protocol vs NGER — Explosives (ANFO)", expanded=False):
 
-        st.markdown("""
-#### Dual-Framework Treatment of Explosives
-
-Explosives (ANFO) are treated differently under the two reporting frameworks
-used in this model.  The table below summarises the position.
-
-| Aspect | GHG Protocol (Tab 1) | NGER (Safeguard / Tab 2) |
-|--------|---------------------|--------------------------|
-| **Scope 1 emissions** | Yes — 0.17 t CO₂/t ANFO | No — not reportable |
-| **Basis** | AGO / Dept of Climate Change emission factor; GHG Protocol Corporate Standard | CER guideline s2.7 (July 2025); NGER Measurement Determination s2.68 |
-| **Rationale** | Detonation of fossil fuel component is a direct emission at the facility | Fuel oil in ANFO is reported as consumed without combustion by the entity at the point of final mixing |
-| **Reporting entity** | Facility operator (regardless of who detonates) | Entity with operational control at point of final mixing (Orica) |
-| **Scope 3** | Not applicable (Scope 1 captures the detonation) | Not applicable |
-
-**Implementation in this model:**
-
-- **Tab 1 (GHG):** Explosives consumption (kg) is multiplied by 0.17 t CO₂/t
-  (converted to kg basis) and included in Scope 1.  These rows are flagged
-  `GHG_Only = True` so they can be excluded from NGER calculations.
-
-- **Tab 2 (Safeguard):** GHG-only rows are excluded from baseline calculations,
-  emission intensity and SMC computation.  The Safeguard Mechanism operates
-  under NGER, where explosives carry zero emissions.
-
-- **Emission factor source:** AGO / Department of Climate Change, as applied
-  in Australian mining GHG assessments (e.g. Balmoral South Iron Ore Project,
-  Kewan Bond Pty Ltd, 2008).  Factor is pending confirmation against the
-  current NGA Factors publication.
-
-**Contracted blasting (Orica):**  Orica detonates on site under contract.
-Under strict GHG Protocol operational control, this could be argued as
-Scope 3 (Category 1: Purchased Goods and Services).  However, Australian
-mining industry practice commonly reports ANFO detonation as Scope 1 in
-GHG/GRI disclosures using AGO methods, regardless of who performs the blast.
-This model follows that convention for Tab 1.
-""")
+        st.markdown(_EXPLOSIVES_MD)
 
         st.caption(
             "References: CER Reporting blended fuels, other fuel mixes, bitumen "
@@ -511,51 +629,4 @@ This model follows that convention for Tab 1.
     # =================================================================
     with st.expander("\U0001f4da  References & Data Sources", expanded=False):
 
-        st.markdown("""
-**Primary legislation:**
-- National Greenhouse and Energy Reporting Act 2007 (NGER Act)
-  - s22XB (safeguard mechanism credit units \u2014 issuance)
-  - s22XE (safeguard mechanism credit units \u2014 surrender)
-  - s22XN (restriction on surrender by non-covered facilities)
-  - s22XS (rule-making power for Safeguard Mechanism)
-- National Greenhouse and Energy Reporting (Safeguard Mechanism) Rule 2015
-  - Compilation F2024C00846, registered 02/10/2024
-  - Part 3, Division 2, Subdivision A, s11 (baseline formula)
-  - Part 3, Division 2, Subdivision B, s13 (transition proportion)
-  - Part 3, Division 2, Subdivision C, s14\u2013s16 (emissions intensity determination)
-  - Part 3, Division 5, Subdivision A, s31 (default ERC)
-  - Part 3, Division 5, s32 (default decline rate)
-  - Part 3, Division 5, Subdivision B, s33 (regular facility ERC)
-  - Part 3A, s58B (eligible facility \u2014 opt-in for below-threshold)
-  - Schedule 1 (default and best practice emissions intensities)
-- NGER Regulations 2008 (F2025C01114)
-- NGER (Measurement) Determination 2008
-
-**Regulatory guidance:**
-- DCCEEW: Safeguard Mechanism reforms factsheet (4.9% decline, ERC definition)
-- Clean Energy Regulator: Facility overview for Ravenswood Mine (FY2023\u201324)
-- CER: s58B eligibility guidance (referenced in CER guidance)
-- CER: Confirmation that existing facilities use Default EI (October 2024)
-
-**Facility-specific data:**
-- EID Basis of Preparation (February 2024)
-- NGER Section 19 submission (October 2024)
-  - Production: 11,624,570 t ROM, 101,540.078 MWh
-  - Covered emissions: 137,227 tCO\u2082-e
-  - Calculated baseline: 269,728 tCO\u2082-e (FY2023\u201324, ERC = 0.951)
-  - SMCs issued: 132,501 (CER, January 2025)
-  - Slide 4: FY2024 status and SMC confirmation
-  - Slide 5: FY2025\u2013FY2030 production forecast
-  - Slide 6: FY2025 baseline calculation (214,665 tCO\u2082-e)
-  - Slide 8: Emissions forecast and baseline comparison
-  - Slide 9: SMC cumulative forecast and CER s58B guidance
-
-**Emission factors:**
-- National Greenhouse Accounts Factors 2021\u20132025
-  (Commonwealth of Australia, DCCEEW)
-
-**Model parameters:**
-- Grid connection: 1 July 2027 (baked into consolidated CSV)
-- Diesel classification: on-site mining equipment = stationary energy (NGER Measurement Determination 2008)
-- Transport fuel: road-registered light vehicles only
-""")
\ No newline at end of file
+        st.markdown(_REFERENCES_MD)
\ No newline at end of file